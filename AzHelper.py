@@ -7,22 +7,234 @@ from azure.keyvault.keys import KeyClient
 from azure.keyvault.certificates import CertificateClient
 from azure.mgmt.keyvault import KeyVaultManagementClient
 from azure.mgmt.resource.locks import ManagementLockClient
+from azure.mgmt.resource import SubscriptionClient
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import functools
 import time
 import json
+import logging
+import threading
 import re
-import tempfile
 import os
-from datetime import datetime, timedelta
-from typing import List, Dict, Union, Literal, Tuple
-from subprocess import PIPE, run
+from datetime import datetime
+from typing import List, Dict, Union, Literal, Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from types import SimpleNamespace
+
+try:
+    import orjson
+
+    def _pretty(data) -> str:
+        """Indented JSON for console output"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def _pretty(data) -> str:
+        """Indented JSON for console output"""
+        return json.dumps(data, indent=2, default=str)
+
+
+logger = logging.getLogger(__name__)
+
+# Open upper bound for activity-run queries while a pipeline run has no end time yet
+_FAR_FUTURE = "9999-12-31T23:59:59Z"
+
+# azure-core's RetryPolicy, passed to every SDK client. It already retries 408/429/5xx
+# with exponential backoff and honours Retry-After, so calls are not wrapped in a
+# second retry loop; these settings only bound how long one call may keep retrying.
+_SDK_RETRY = {"retry_total": 5, "retry_backoff_factor": 1.0, "retry_backoff_max": 30}
+
+_ARM_ENDPOINT = "https://management.azure.com"
+_ADF_API_VERSION = "?api-version=2018-06-01"
+
+
+@functools.lru_cache(maxsize=32)
+def _fqdn_pattern(old_fqdn: str) -> re.Pattern:
+    """Compiled pattern matching the Snowflake account host old_fqdn right after '://'"""
+    return re.compile(rf"(?<=://){re.escape(old_fqdn)}(?=\.)")
+
+
+# Linked service type -> (typeProperties key holding the account host, label for messages)
+_SF_KEY = {"Snowflake": ("connectionString", "connection string")}
+_SF_V2_KEY = ("accountIdentifier", "account identifier")
+
+
+_default_credential = None
+_default_credential_lock = threading.Lock()
+
+
+def get_default_credential() -> DefaultAzureCredential:
+    """
+    Return the process-wide DefaultAzureCredential, creating it on first use.
+    Resource classes use it when no credential is passed, so they share one
+    credential (and its token cache) and the SDK clients cached for it.
+    """
+    global _default_credential
+    if _default_credential is None:
+        with _default_credential_lock:
+            if _default_credential is None:
+                _default_credential = DefaultAzureCredential()
+    return _default_credential
+
+
+def reset_default_credential() -> None:
+    """Forget the shared credential so the next resource builds a fresh one, e.g. in tests."""
+    global _default_credential
+    with _default_credential_lock:
+        _default_credential = None
+
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide requests session used for direct ARM REST calls.
+    Sharing it keeps TCP/TLS connections to management.azure.com alive across
+    resources. Idempotent requests are retried on throttling and transient 5xx.
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(
+                        pool_connections=20,
+                        pool_maxsize=50,
+                        max_retries=Retry(
+                            total=3,
+                            backoff_factor=0.5,
+                            status_forcelist=[429, 500, 502, 503, 504],
+                            raise_on_status=False,
+                        ),
+                    ),
+                )
+                _http_session = session
+    return _http_session
+
+
+def _build_keyvault_clients(credential, subscription_id, vault_name) -> Dict:
+    vault_url = f"https://{vault_name}.vault.azure.net"
+    return {
+        "kv_client": KeyVaultManagementClient(
+            credential=credential, subscription_id=subscription_id, **_SDK_RETRY
+        ),
+        "secret_client": SecretClient(
+            vault_url=vault_url, credential=credential, **_SDK_RETRY
+        ),
+        "key_client": KeyClient(vault_url=vault_url, credential=credential, **_SDK_RETRY),
+        "certificate_client": CertificateClient(
+            vault_url=vault_url, credential=credential, **_SDK_RETRY
+        ),
+    }
+
+
+# resource_type -> builder(credential, subscription_id, resource_name) returning
+# the SDK clients keyed by the attribute they are exposed as
+_CLIENT_BUILDERS = {
+    "adf": lambda credential, subscription_id, resource_name: {
+        "client": DataFactoryManagementClient(
+            credential=credential, subscription_id=subscription_id, **_SDK_RETRY
+        )
+    },
+    "batch": lambda credential, subscription_id, resource_name: {
+        "client": BatchManagementClient(
+            credential=credential, subscription_id=subscription_id, **_SDK_RETRY
+        )
+    },
+    "keyvault": _build_keyvault_clients,
+    "locks": lambda credential, subscription_id, resource_name: {
+        "lock_client": ManagementLockClient(
+            credential=credential, subscription_id=subscription_id, **_SDK_RETRY
+        )
+    },
+}
 
 
 class AzureResourceBase:
+    # (resource_type, subscription_id, credential id[, vault name]) -> {attribute: client}
+    _client_cache: Dict[Tuple, Dict] = {}
+    # Subscription ID resolved once per process, shared by all instances
+    _cached_subscription_id: str = None
+    # (credential id, scope) -> (bearer token, refresh time), shared by all instances
+    _token_cache: Dict[Tuple, Tuple[str, float]] = {}
+    _token_cache_lock = threading.Lock()
+
     def get_subscription_id(self):
-        """Get the current subscription ID using Azure CLI"""
-        cmd = "az account show --query id --output tsv"
-        return self.run_cmd(cmd).stdout.strip()
+        """
+        Get the current subscription ID.
+        AZURE_SUBSCRIPTION_ID wins if set. Otherwise the lookup runs once per process:
+        the default subscription in the Azure CLI profile file, else the subscription
+        visible to the credential if there is exactly one.
+        
+        Raises:
+            ValueError: If no subscription can be determined
+        """
+        env_subscription_id = os.environ.get("AZURE_SUBSCRIPTION_ID")
+        if env_subscription_id:
+            return env_subscription_id
+
+        if AzureResourceBase._cached_subscription_id is None:
+            subscription_id = self._get_profile_subscription_id()
+            if not subscription_id:
+                subscription_id = self._get_sole_subscription_id()
+            if not subscription_id:
+                raise ValueError(
+                    "Could not determine the subscription ID. Set AZURE_SUBSCRIPTION_ID, "
+                    "run 'az login' or pass subscription_id explicitly."
+                )
+            AzureResourceBase._cached_subscription_id = subscription_id
+        return AzureResourceBase._cached_subscription_id
+
+    @staticmethod
+    def _get_profile_subscription_id():
+        """
+        Return the default subscription ID from the Azure CLI profile file, without
+        starting the CLI. None if the file is missing, malformed or has no default.
+        """
+        config_dir = os.environ.get("AZURE_CONFIG_DIR") or os.path.join(
+            os.path.expanduser("~"), ".azure"
+        )
+        profile_path = os.path.join(config_dir, "azureProfile.json")
+        try:
+            # The CLI writes this file with a BOM
+            with open(profile_path, encoding="utf-8-sig") as f:
+                profile = json.load(f)
+            for subscription in profile.get("subscriptions", []):
+                if subscription.get("isDefault"):
+                    return subscription.get("id")
+        except (OSError, ValueError, AttributeError):
+            return None
+        return None
+
+    def _get_sole_subscription_id(self):
+        """
+        Return the subscription ID if the credential can see exactly one subscription.
+        With several subscriptions the choice is ambiguous, so None is returned.
+        """
+        try:
+            subscriptions = list(
+                islice(SubscriptionClient(self.credential).subscriptions.list(), 2)
+            )
+        except Exception as e:
+            logger.warning("Could not list subscriptions: %s", e)
+            return None
+        if len(subscriptions) == 1:
+            return subscriptions[0].subscription_id
+        return None
+
+    @classmethod
+    def reset_subscription_cache(cls) -> None:
+        """Forget the cached subscription ID, e.g. after switching subscriptions in the CLI."""
+        AzureResourceBase._cached_subscription_id = None
 
     def __init__(
         self,
@@ -30,6 +242,7 @@ class AzureResourceBase:
         resource_name: str,
         resource_type: Literal["adf", "batch", "keyvault", "locks"],
         subscription_id: str = None,
+        credential: DefaultAzureCredential = None,
     ):
         """
         Base class for Azure resource operations.
@@ -38,71 +251,77 @@ class AzureResourceBase:
             resource_group_name: Name of the resource group
             resource_name: Name of the resource (ADF factory, Batch account, or Key Vault)
             resource_type: Type of resource ('adf', 'batch', or 'keyvault')
-            subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
+            subscription_id: Azure subscription ID. If not provided, uses AZURE_SUBSCRIPTION_ID or the Azure CLI
+            credential: Optional credential. Defaults to the shared credential from
+                get_default_credential(); SDK clients are cached per credential
         """
         self.resource_group_name = resource_group_name
         self.resource_name = resource_name
         self.resource_type = resource_type.lower()
+        build_clients = _CLIENT_BUILDERS.get(self.resource_type)
+        if build_clients is None:
+            raise ValueError(
+                f"Unsupported resource type: {resource_type}. Must be 'adf', 'batch', 'keyvault', or 'locks'"
+            )
+        self.credential = credential or get_default_credential()
         self.subscription_id = subscription_id or self.get_subscription_id()
-        self.credential = DefaultAzureCredential()
         self.token = None
         self.token_expiry = None
+        # ARM URL of the factory, built once for the REST calls the SDK doesn't cover
+        self._factory_url = (
+            f"{_ARM_ENDPOINT}/subscriptions/{self.subscription_id}/resourcegroups/"
+            f"{resource_group_name}/providers/Microsoft.DataFactory/factories/{resource_name}"
+            if self.resource_type == "adf"
+            else None
+        )
 
-        # Initialize appropriate client based on resource type
-        if self.resource_type == "adf":
-            self.client = DataFactoryManagementClient(
-                credential=self.credential, subscription_id=self.subscription_id
-            )
-        elif self.resource_type == "batch":
-            self.client = BatchManagementClient(
-                credential=self.credential, subscription_id=self.subscription_id
-            )
-        elif self.resource_type == "keyvault":
-            self.kv_client = KeyVaultManagementClient(
-                credential=self.credential, subscription_id=self.subscription_id
-            )
-            self.secret_client = SecretClient(
-                vault_url=f"https://{resource_name}.vault.azure.net",
-                credential=self.credential,
-            )
-            self.key_client = KeyClient(
-                vault_url=f"https://{resource_name}.vault.azure.net",
-                credential=self.credential,
-            )
-            self.certificate_client = CertificateClient(
-                vault_url=f"https://{resource_name}.vault.azure.net",
-                credential=self.credential,
-            )
-        elif self.resource_type == "locks":
-            self.lock_client = ManagementLockClient(
-                credential=self.credential, subscription_id=self.subscription_id
-            )
-        else:
-            raise ValueError(
-                f"Unsupported resource type: {resource_type}. Must be 'adf', 'batch', 'keyvault', or 'locks'"
+        # Key Vault data-plane clients are bound to a vault URL, the others only to the subscription
+        cache_key = (self.resource_type, self.subscription_id, id(self.credential))
+        if self.resource_type == "keyvault":
+            cache_key += (resource_name,)
+        clients = self._client_cache.get(cache_key)
+        if clients is None:
+            clients = self._client_cache.setdefault(
+                cache_key,
+                build_clients(self.credential, self.subscription_id, resource_name),
             )
+        for attr, client in clients.items():
+            setattr(self, attr, client)
 
-    def _get_token(self):
-        """
-        Get a new token if current one is expired or doesn't exist
+    @classmethod
+    def clear_client_cache(cls) -> None:
+        """Drop all cached SDK clients and tokens, e.g. between tests."""
+        cls._client_cache.clear()
+        with AzureResourceBase._token_cache_lock:
+            cls._token_cache.clear()
+
+    def _get_token(self, scope: str = "https://management.azure.com/.default"):
         """
-        now = datetime.now()
-        if (
-            self.token is None
-            or self.token_expiry is None
-            or (self.token_expiry is not None and now >= self.token_expiry)
-        ):
-            print("Generating new token...")
-            token_response = self.credential.get_token(
-                "https://management.azure.com/.default"
-            )
-            self.token = token_response.token
-            # Convert expires_on (Unix timestamp) to datetime
-            self.token_expiry = datetime.fromtimestamp(
-                token_response.expires_on
-            ) - timedelta(minutes=5)
+        Get a bearer token for scope, reusing the one cached for this credential until
+        5 minutes before it expires. Instances sharing a credential share the token.
+        
+        Args:
+            scope: OAuth scope to request the token for
+        """
+        cache_key = (id(self.credential), scope)
+        cached = self._token_cache.get(cache_key)
+        # Double-checked so concurrent callers don't all fetch a token at once
+        if cached is None or time.time() >= cached[1]:
+            with AzureResourceBase._token_cache_lock:
+                cached = self._token_cache.get(cache_key)
+                if cached is None or time.time() >= cached[1]:
+                    logger.info("Generating new token...")
+                    token_response = self.credential.get_token(scope)
+                    # expires_on is a Unix timestamp; refresh 5 minutes early
+                    cached = (token_response.token, token_response.expires_on - 300)
+                    self._token_cache[cache_key] = cached
+        self.token, self.token_expiry = cached
         return self.token
 
+    def _adf_url(self, path: str) -> str:
+        """ARM REST URL for path below the factory, including the api-version"""
+        return f"{self._factory_url}/{path}{_ADF_API_VERSION}"
+
     def get_resource_details(self):
         """
         Get details of the resource based on its type
@@ -122,20 +341,20 @@ class AzureResourceBase:
             print(f"Error getting {self.resource_type} details: {str(e)}")
             raise
 
-    @staticmethod
-    def run_cmd(msg):
-        """Run a shell command and return the result"""
-        return run(
-            args=msg, stdout=PIPE, stderr=PIPE, universal_newlines=True, shell=True
-        )
-
 
 class ADFLinkedServices(AzureResourceBase):
     def list_linked_services(
-        self, filter_by_type: Union[str, List[str]] = None
+        self, filter_by_type: Union[str, List[str]] = None, serialize: bool = False
     ) -> List[Dict]:
         """
         List all linked services in the Azure Data Factory.
+        
+        Args:
+            filter_by_type: Optional linked service type or list of types to keep
+            serialize: If True, return REST-shaped (camelCase) dictionaries like
+                get_linked_service_details, which update_linked_service_sf_account
+                accepts directly. Otherwise as_dict() output is returned, which is
+                snake_case on msrest-based SDKs and already camelCase on 10.x.
         """
         try:
             # Get all linked services
@@ -144,24 +363,23 @@ class ADFLinkedServices(AzureResourceBase):
                 factory_name=self.resource_name,
             )
 
-            # Convert to list of dictionaries and filter if needed
+            if isinstance(filter_by_type, str):
+                wanted_types = {filter_by_type}
+            else:
+                wanted_types = set(filter_by_type) if filter_by_type else None
+
+            # Filter on the model's type first so only kept services are converted to dicts
             services_list = []
             for service in linked_services:
-                service_dict = service.as_dict()
-
-                # If filter_by_type is specified, check if service type matches
-                if filter_by_type:
-                    service_type = service_dict.get("properties", {}).get("type")
-                    if isinstance(filter_by_type, str):
-                        # Single type filter
-                        if service_type == filter_by_type:
-                            services_list.append(service_dict)
-                    elif isinstance(filter_by_type, list):
-                        # Multiple type filter
-                        if service_type in filter_by_type:
-                            services_list.append(service_dict)
+                if wanted_types is not None and service.properties.type not in wanted_types:
+                    continue
+                # msrest models (older SDKs) need serialize() for the REST shape; the
+                # azure-mgmt-datafactory 10.x models have no serialize() and their
+                # as_dict() is already REST-shaped
+                if serialize and hasattr(service, "serialize"):
+                    services_list.append(service.serialize(keep_readonly=True))
                 else:
-                    services_list.append(service_dict)
+                    services_list.append(service.as_dict())
 
             return services_list
 
@@ -175,7 +393,7 @@ class ADFLinkedServices(AzureResourceBase):
         """
         try:
             # Construct the API URL
-            api_url = f"https://management.azure.com/subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group_name}/providers/Microsoft.DataFactory/factories/{self.resource_name}/linkedservices/{linked_service_name}?api-version=2018-06-01"
+            api_url = self._adf_url(f"linkedservices/{linked_service_name}")
 
             # Make the API call
             headers = {
@@ -183,7 +401,7 @@ class ADFLinkedServices(AzureResourceBase):
                 "Content-Type": "application/json",
             }
 
-            response = requests.get(api_url, headers=headers)
+            response = get_http_session().get(api_url, headers=headers)
             response.raise_for_status()
 
             return response.json()
@@ -212,13 +430,23 @@ class ADFLinkedServices(AzureResourceBase):
         old_fqdn: str,
         new_fqdn: str,
         dry_run: bool = True,
+        linked_service: Dict = None,
     ) -> Dict:
         """
         Update the Snowflake account FQDN in a linked service.
+        
+        Args:
+            linked_service_name: Name of the linked service
+            old_fqdn: Account host to replace
+            new_fqdn: New account host
+            dry_run: If True, only show the new configuration
+            linked_service: Current REST-shaped definition, e.g. from
+                list_linked_services(serialize=True). Fetched when not given.
         """
         try:
-            # Get the current linked service details
-            linked_service = self.get_linked_service_details(linked_service_name)
+            # Get the current linked service details unless the caller already has them
+            if linked_service is None:
+                linked_service = self.get_linked_service_details(linked_service_name)
 
             # Check if it's a Snowflake service
             service_type = linked_service.get("properties", {}).get("type")
@@ -226,43 +454,17 @@ class ADFLinkedServices(AzureResourceBase):
                 f"Updating {service_type} Linked Service {linked_service_name} from {old_fqdn} to {new_fqdn}"
             )
 
-            # Update the connection string based on Snowflake version
-            if service_type == "Snowflake":
-                # For Snowflake V1
-                connection_string = linked_service["properties"]["typeProperties"][
-                    "connectionString"
-                ]
-                new_connection_string = re.sub(
-                    f"(?<=://){re.escape(old_fqdn)}(?=\.)", new_fqdn, connection_string
-                )
-                # Check if the regex found a match, no replacement happened
-                if new_connection_string == connection_string:
-                    print(
-                        f"Warning: Could not find exact match for '{old_fqdn}' in connection string"
-                    )
-                    return
-                print(f"New ConnectionString: {new_connection_string}")
-                linked_service["properties"]["typeProperties"][
-                    "connectionString"
-                ] = new_connection_string
-
-            else:
-                # For Snowflake V2
-                current_identifier = linked_service["properties"]["typeProperties"][
-                    "accountIdentifier"
-                ]
-                new_identifier = re.sub(
-                    f"(?<=://){re.escape(old_fqdn)}(?=\.)", new_fqdn, current_identifier
-                )
-                # Check if the regex found a match, no replacement happened
-                if new_identifier == current_identifier:
-                    print(
-                        f"Warning: Could not find exact match for '{old_fqdn}' in account identifier"
-                    )
-                    return
-                linked_service["properties"]["typeProperties"][
-                    "accountIdentifier"
-                ] = new_identifier
+            # Snowflake V1 keeps the host in connectionString, V2 in accountIdentifier
+            key, label = _SF_KEY.get(service_type, _SF_V2_KEY)
+            type_properties = linked_service["properties"]["typeProperties"]
+            current_value = type_properties[key]
+            new_value = _fqdn_pattern(old_fqdn).sub(new_fqdn, current_value)
+            # Check if the regex found a match, no replacement happened
+            if new_value == current_value:
+                print(f"Warning: Could not find exact match for '{old_fqdn}' in {label}")
+                return
+            print(f"New {key}: {new_value}")
+            type_properties[key] = new_value
 
             if dry_run:
                 print(f"What if: Would update linked service {linked_service_name}")
@@ -301,7 +503,7 @@ class ADFLinkedServices(AzureResourceBase):
             body = {"linkedService": linked_service}
 
             # Construct the API URL
-            api_url = f"https://management.azure.com/subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group_name}/providers/Microsoft.DataFactory/factories/{self.resource_name}/testConnectivity?api-version=2018-06-01"
+            api_url = self._adf_url("testConnectivity")
 
             # Make the API call
             headers = {
@@ -312,7 +514,7 @@ class ADFLinkedServices(AzureResourceBase):
             print("Testing linked service connection with the following configuration:")
             print(json.dumps(body, indent=2))
 
-            response = requests.post(api_url, headers=headers, json=body)
+            response = get_http_session().post(api_url, headers=headers, json=body)
             response.raise_for_status()
 
             result = response.json()
@@ -363,7 +565,10 @@ class ADFManagedPrivateEndpoint(AzureResourceBase):
             )
 
             # Construct the REST API URL
-            url = f"https://management.azure.com/subscriptions/{self.subscription_id}/resourceGroups/{self.resource_group_name}/providers/Microsoft.DataFactory/factories/{self.resource_name}/managedVirtualNetworks/{managed_vnet_name}/managedPrivateEndpoints/{managed_private_endpoint_name}?api-version=2018-06-01"
+            url = self._adf_url(
+                f"managedVirtualNetworks/{managed_vnet_name}"
+                f"/managedPrivateEndpoints/{managed_private_endpoint_name}"
+            )
 
             # Prepare the request body
             body = {
@@ -383,7 +588,7 @@ class ADFManagedPrivateEndpoint(AzureResourceBase):
                 "Content-Type": "application/json",
             }
 
-            response = requests.put(url, headers=headers, json=body)
+            response = get_http_session().put(url, headers=headers, json=body)
             response.raise_for_status()
 
             print(
@@ -403,8 +608,7 @@ class ADFIntegrationRuntime(AzureResourceBase):
         """
         try:
             # Construct the API URL
-            ir_resource_id = f"subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group_name}/providers/Microsoft.DataFactory/factories/{self.resource_name}/integrationruntimes/{ir_name}"
-            api_url = f"https://management.azure.com/{ir_resource_id}/getStatus?api-version=2018-06-01"
+            api_url = self._adf_url(f"integrationruntimes/{ir_name}/getStatus")
 
             # Make the API call
             headers = {
@@ -412,7 +616,7 @@ class ADFIntegrationRuntime(AzureResourceBase):
                 "Content-Type": "application/json",
             }
 
-            response = requests.post(api_url, headers=headers)
+            response = get_http_session().post(api_url, headers=headers)
             response.raise_for_status()
 
             return response.json()
@@ -481,8 +685,7 @@ class ADFIntegrationRuntime(AzureResourceBase):
             return
 
         # Construct the API URL
-        ir_resource_id = f"subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group_name}/providers/Microsoft.DataFactory/factories/{self.resource_name}/integrationruntimes/{ir_name}"
-        api_url = f"https://management.azure.com/{ir_resource_id}/enableInteractiveQuery?api-version=2018-06-01"
+        api_url = self._adf_url(f"integrationruntimes/{ir_name}/enableInteractiveQuery")
 
         # Make the API call
         headers = {
@@ -491,7 +694,7 @@ class ADFIntegrationRuntime(AzureResourceBase):
         }
         body = {"autoTerminationMinutes": minutes}
 
-        response = requests.post(api_url, headers=headers, json=body)
+        response = get_http_session().post(api_url, headers=headers, json=body)
         response.raise_for_status()
 
         print(f"Successfully triggered interactive authoring for {minutes} minutes")
@@ -508,6 +711,7 @@ class AzureBatchPool(AzureResourceBase):
         resource_name: str,
         pool_name: str,
         subscription_id: str = None,
+        credential: DefaultAzureCredential = None,
     ):
         """
         Initialize Azure Batch Pool operations.
@@ -517,14 +721,44 @@ class AzureBatchPool(AzureResourceBase):
             resource_name: Name of the batch account
             pool_name: Name of the pool
             subscription_id: Optional subscription ID
+            credential: Optional credential. Defaults to the shared process-wide credential
         """
         super().__init__(
             resource_group_name=resource_group_name,
             resource_name=resource_name,
             resource_type="batch",
             subscription_id=subscription_id,
+            credential=credential,
         )
         self.pool_name = pool_name
+        # Last node count seen by get_pool_config or set by scale_pool_nodes
+        self._current_nodes = None
+
+    @property
+    def current_nodes(self) -> int:
+        """
+        Fixed-scale target dedicated node count last read by get_pool_config or set by
+        scale_pool_nodes. 0 for auto-scale pools, None before the pool was read.
+        """
+        return self._current_nodes
+
+    @staticmethod
+    def _dedicated_nodes(pool_config: Dict) -> int:
+        """
+        Read the fixed-scale target dedicated node count from a pool configuration.
+        Accepts both the SDK's as_dict() keys and the REST (camelCase) keys.
+        """
+        scale_settings = (
+            pool_config.get("scale_settings") or pool_config.get("scaleSettings") or {}
+        )
+        fixed_scale = (
+            scale_settings.get("fixed_scale") or scale_settings.get("fixedScale") or {}
+        )
+        return (
+            fixed_scale.get("target_dedicated_nodes")
+            or fixed_scale.get("targetDedicatedNodes")
+            or 0
+        )
 
     def get_pool_config(self) -> Dict:
         """
@@ -539,18 +773,28 @@ class AzureBatchPool(AzureResourceBase):
                 account_name=self.resource_name,
                 pool_name=self.pool_name,
             )
-            return response.as_dict()
+            pool_config = response.as_dict()
+            self._current_nodes = self._dedicated_nodes(pool_config)
+            return pool_config
         except Exception as e:
-            print(f"Error getting pool configuration: {str(e)}")
+            logger.error("Error getting pool configuration: %s", e)
             raise
 
-    def scale_pool_nodes(self, target_nodes: int, dry_run: bool = True) -> Dict:
+    def scale_pool_nodes(
+        self, target_nodes: int, dry_run: bool = True, verify_current: bool = False
+    ) -> Dict:
         """
         Scale the number of nodes in the batch pool.
         
+        Outside of dry run the pool is patched with only the new scale settings;
+        the current configuration is fetched first only for a dry run (to show the
+        resulting configuration) or when verify_current is set.
+        
         Args:
             target_nodes: Target number of nodes (0 or positive integer)
             dry_run: If True, only show what would be changed without making changes
+            verify_current: If True, re-read the pool before scaling instead of relying
+                on the last node count seen by this instance
             
         Returns:
             Dict containing the updated pool configuration
@@ -559,56 +803,107 @@ class AzureBatchPool(AzureResourceBase):
             if target_nodes < 0:
                 raise ValueError("Target nodes must be 0 or a positive integer")
 
-            # Get current pool configuration
-            pool_config = self.get_pool_config()
-            current_nodes = (
-                pool_config.get("scaleSettings", {})
-                .get("fixedScale", {})
-                .get("targetDedicatedNodes", 0)
+            pool_config = None
+            if dry_run or verify_current:
+                pool_config = self.get_pool_config()
+            current_nodes = self._current_nodes
+
+            logger.info(
+                "Current node count: %s",
+                "unknown" if current_nodes is None else current_nodes,
             )
+            logger.info("Target node count: %s", target_nodes)
 
-            print(f"Current node count: {current_nodes}")
-            print(f"Target node count: {target_nodes}")
+            scale_settings = {"fixedScale": {"targetDedicatedNodes": target_nodes}}
 
             if current_nodes == target_nodes:
-                print(
-                    f"Pool {self.pool_name} already has {target_nodes} nodes. No changes needed."
+                logger.info(
+                    "Pool %s already has %s nodes. No changes needed.",
+                    self.pool_name,
+                    target_nodes,
                 )
-                return pool_config
-
-            # Update the scale settings
-            pool_config["scaleSettings"] = {
-                "fixedScale": {"targetDedicatedNodes": target_nodes}
-            }
+                return pool_config or {"scaleSettings": scale_settings}
 
             if dry_run:
-                print(
-                    f"What if: Would scale pool {self.pool_name} to {target_nodes} nodes"
+                # Update the scale settings
+                pool_config["scaleSettings"] = scale_settings
+                logger.info(
+                    "What if: Would scale pool %s to %s nodes",
+                    self.pool_name,
+                    target_nodes,
                 )
-                print("New configuration:")
-                print(json.dumps(pool_config, indent=2))
+                logger.info("New configuration:\n%s", _pretty(pool_config))
                 return pool_config
 
-            # Update the pool
+            # Patch only the scale settings
             response = self.client.pool.update(
                 resource_group_name=self.resource_group_name,
                 account_name=self.resource_name,
                 pool_name=self.pool_name,
-                parameters=pool_config,
+                parameters={"scaleSettings": scale_settings},
             )
+            self._current_nodes = target_nodes
 
-            print(f"Successfully scaled pool {self.pool_name} to {target_nodes} nodes")
+            logger.info(
+                "Successfully scaled pool %s to %s nodes", self.pool_name, target_nodes
+            )
             return response.as_dict()
 
         except Exception as e:
-            print(f"Error scaling pool nodes: {str(e)}")
+            logger.error("Error scaling pool nodes: %s", e)
             raise
 
 
 class AzureKeyVault(AzureResourceBase):
+    def __init__(
+        self,
+        resource_group_name: str,
+        resource_name: str,
+        resource_type: str = "keyvault",
+        subscription_id: str = None,
+        credential: DefaultAzureCredential = None,
+        secret_ttl: float = 300,
+    ):
+        """
+        Initialize Azure Key Vault operations.
+        
+        Args:
+            resource_group_name: Name of the resource group
+            resource_name: Name of the key vault
+            resource_type: Kept for compatibility, must be 'keyvault'
+            subscription_id: Azure subscription ID. If not provided, uses AZURE_SUBSCRIPTION_ID or the Azure CLI
+            credential: Optional credential. Defaults to the shared process-wide credential
+            secret_ttl: Seconds a fetched secret value is reused before it is read again
+        """
+        super().__init__(
+            resource_group_name=resource_group_name,
+            resource_name=resource_name,
+            resource_type=resource_type,
+            subscription_id=subscription_id,
+            credential=credential,
+        )
+        # secret name -> (value, monotonic expiry)
+        self._secret_cache: Dict[str, Tuple[str, float]] = {}
+        self._secret_ttl = secret_ttl
+        self._secret_lock = threading.Lock()
+
+    def invalidate(self, secret_name: str = None) -> None:
+        """
+        Drop a cached secret value, or every cached value when no name is given.
+        
+        Args:
+            secret_name: Name of the secret to forget
+        """
+        with self._secret_lock:
+            if secret_name is None:
+                self._secret_cache.clear()
+            else:
+                self._secret_cache.pop(secret_name, None)
+
     def get_secret(self, secret_name: str) -> str:
         """
         Get a secret from the key vault.
+        Values are cached for secret_ttl seconds.
         
         Args:
             secret_name: Name of the secret to retrieve
@@ -617,10 +912,45 @@ class AzureKeyVault(AzureResourceBase):
             The secret value as a string
         """
         try:
+            with self._secret_lock:
+                cached = self._secret_cache.get(secret_name)
+            if cached is not None and time.monotonic() < cached[1]:
+                return cached[0]
+
             secret = self.secret_client.get_secret(secret_name)
+            with self._secret_lock:
+                self._secret_cache[secret_name] = (
+                    secret.value,
+                    time.monotonic() + self._secret_ttl,
+                )
             return secret.value
         except Exception as e:
-            print(f"Error getting secret {secret_name}: {str(e)}")
+            logger.error("Error getting secret %s: %s", secret_name, e)
+            raise
+
+    @staticmethod
+    def _secret_info(secret) -> Dict:
+        """Summary of a secret's properties, without its value"""
+        return {
+            "name": secret.name,
+            "created_on": secret.created_on,
+            "updated_on": secret.updated_on,
+            "enabled": secret.enabled,
+        }
+
+    def iter_secrets(self) -> Iterator[Dict]:
+        """
+        Lazily iterate secrets in the current key vault.
+        Pages are only fetched as the caller consumes the iterator.
+        
+        Returns:
+            Iterator of dictionaries containing secret properties (name, created_on, updated_on, enabled)
+        """
+        try:
+            for secret in self.secret_client.list_properties_of_secrets():
+                yield self._secret_info(secret)
+        except Exception as e:
+            logger.error("Error listing secrets: %s", e)
             raise
 
     def list_secrets(self) -> List[Dict]:
@@ -631,19 +961,9 @@ class AzureKeyVault(AzureResourceBase):
             List of dictionaries containing secret properties (name, created_on, updated_on, enabled)
         """
         try:
-            secrets = []
-            for secret in self.secret_client.list_properties_of_secrets():
-                secrets.append(
-                    {
-                        "name": secret.name,
-                        "created_on": secret.created_on,
-                        "updated_on": secret.updated_on,
-                        "enabled": secret.enabled,
-                    }
-                )
-            return secrets
+            return [self._secret_info(secret) for secret in self.secret_client.list_properties_of_secrets()]
         except Exception as e:
-            print(f"Error listing secrets: {str(e)}")
+            logger.error("Error listing secrets: %s", e)
             raise
 
     def set_secret(self, secret_name: str, secret_value: str) -> None:
@@ -656,111 +976,219 @@ class AzureKeyVault(AzureResourceBase):
         """
         try:
             self.secret_client.set_secret(secret_name, secret_value)
-            print(
-                f"Successfully set secret {secret_name} in {self.resource_name} under {self.resource_group_name}"
+            self.invalidate(secret_name)
+            logger.info(
+                "Successfully set secret %s in %s under %s",
+                secret_name,
+                self.resource_name,
+                self.resource_group_name,
             )
         except Exception as e:
-            print(f"Error setting secret {secret_name}: {str(e)}")
+            logger.error("Error setting secret %s: %s", secret_name, e)
             raise
 
 
 class AzureResourceLock(AzureResourceBase):
-    def __init__(self, resource_group_name: str, subscription_id: str = None):
+    LOCK_LEVELS = frozenset({"CanNotDelete", "ReadOnly"})
+    # Concurrent lock writes; ARM starts throttling well before this matters for a resource group
+    MAX_WORKERS = 8
+
+    def __init__(
+        self,
+        resource_group_name: str,
+        subscription_id: str = None,
+        credential: DefaultAzureCredential = None,
+    ):
         """
         Initialize Azure Resource Locker operations.
         
         Args:
             resource_group_name: Name of the resource group
             subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
+            credential: Optional credential. Defaults to the shared process-wide credential
         """
         super().__init__(
             resource_group_name=resource_group_name,
             resource_name=None,  # Not needed for lock operations
             resource_type="locks",  # Custom type for lock operations
             subscription_id=subscription_id,
+            credential=credential,
         )
-        self.lock_client = ManagementLockClient(
-            credential=self.credential, subscription_id=self.subscription_id
-        )
-        # Initialize lock objects
-        self.lock_objs = self.get_locks()
+        # lock name -> lock; listed on first access, not on construction
+        self._locks = None
         self.deleted = False
+        # Names of locks actually deleted by release_locks and not yet put back
+        self.released = set()
+
+    @property
+    def locks_by_name(self) -> Dict:
+        """Locks in the resource group keyed by name, listed once on first access and tracked locally after that"""
+        if self._locks is None:
+            self.lock_objs = self.get_locks()
+        return self._locks
+
+    @property
+    def lock_objs(self) -> List:
+        """Locks in the resource group, as a list"""
+        return list(self.locks_by_name.values())
+
+    @lock_objs.setter
+    def lock_objs(self, value: List) -> None:
+        self._locks = {lock.name: lock for lock in value}
+
+    def iter_locks(self) -> Iterator:
+        """
+        Lazily iterate the locks in the resource group.
+        The pager follows nextLink, so pages are only fetched as the caller consumes them.
+        
+        Returns:
+            Iterator of lock objects
+        """
+        try:
+            yield from self.lock_client.management_locks.list_at_resource_group_level(
+                resource_group_name=self.resource_group_name
+            )
+        except Exception as e:
+            logger.error("Error getting resource locks: %s", e)
+            raise
 
     def get_locks(self) -> List:
         """
-        Get all locks in the resource group.
+        Get all locks in the resource group, across all result pages.
         
         Returns:
             List of lock objects, empty list if no locks exist
         """
         try:
-            all_locks = self.lock_client.management_locks.list_at_resource_group_level(
-                resource_group_name=self.resource_group_name
+            lock_list = list(
+                self.lock_client.management_locks.list_at_resource_group_level(
+                    resource_group_name=self.resource_group_name
+                )
             )
+        except Exception as e:
+            logger.error("Error getting resource locks: %s", e)
+            raise
 
-            # Convert ItemPaged to list
-            lock_list = list(all_locks)
+        if not lock_list:
+            logger.info("No locks found in resource group %s", self.resource_group_name)
+        else:
+            logger.info(
+                "Found %s locks in resource group %s",
+                len(lock_list),
+                self.resource_group_name,
+            )
 
-            if not lock_list:
-                print(f"No locks found in resource group {self.resource_group_name}")
-            else:
-                print(
-                    f"Found {len(lock_list)} locks in resource group {self.resource_group_name}"
-                )
+        return lock_list
 
-            return lock_list
+    async def get_locks_async(self) -> List:
+        """
+        Async version of get_locks. The SDK call runs in a worker thread, so it can be
+        awaited with asyncio.gather alongside other resources' calls.
+        
+        Returns:
+            List of lock objects
+        """
+        return await asyncio.to_thread(self.get_locks)
 
-        except Exception as e:
-            print(f"Error getting resource locks: {str(e)}")
-            raise
+    def _delete_lock(self, lock_name: str) -> None:
+        self.lock_client.management_locks.delete_at_resource_group_level(
+            self.resource_group_name, lock_name
+        )
 
-    def release_locks(self) -> None:
+    def _put_lock(self, lock_name: str, level: str, notes: str = None) -> None:
+        self.lock_client.management_locks.create_or_update_at_resource_group_level(
+            resource_group_name=self.resource_group_name,
+            lock_name=lock_name,
+            parameters={"level": level, "notes": notes},
+        )
+
+    def refresh(self) -> List:
         """
-        Delete all locks in the resource group.
+        Re-read the locks in the resource group, e.g. after they were changed elsewhere.
         
         Returns:
-            List of lock objects that were deleted
+            List of lock objects
+        """
+        self.lock_objs = self.get_locks()
+        return self.lock_objs
+
+    def release_locks(self) -> None:
+        """
+        Delete all locks in the resource group.
+        Each lock that is deleted is recorded in released, so recreate_locks can put
+        it back even when other deletions fail.
         """
         try:
-            if not self.lock_objs:
-                print("No locks to delete")
+            if not self.locks_by_name:
+                logger.info("No locks to delete")
                 return
 
-            for lock in self.lock_objs:
-                self.lock_client.management_locks.delete_at_resource_group_level(
-                    self.resource_group_name, lock.name
-                )
-                print(f"Temporarily released lock: {lock.name}")
+            # Locks deleted by an earlier, partly failed call are not deleted again
+            locks = [
+                lock for name, lock in self.locks_by_name.items() if name not in self.released
+            ]
+            if not locks:
+                logger.info("Locks were already released, skipping deletion")
+                return
 
+            # One ARM call per lock; run them side by side, capped for the write throttle
+            failed = []
+            max_workers = min(self.MAX_WORKERS, len(locks))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._delete_lock, lock.name): lock for lock in locks
+                }
+                for future in as_completed(futures):
+                    lock = futures[future]
+                    try:
+                        future.result()
+                        self.released.add(lock.name)
+                        logger.info("Temporarily released lock: %s", lock.name)
+                    except Exception as e:
+                        logger.error("Error releasing lock %s: %s", lock.name, e)
+                        failed.append(lock.name)
+
+            if failed:
+                raise RuntimeError(f"Failed to release locks: {', '.join(failed)}")
             self.deleted = True
         except Exception as e:
-            print(f"Error managing resource locks: {str(e)}")
+            logger.error("Error managing resource locks: %s", e)
             raise
 
     def recreate_locks(self) -> None:
         """
-        Recreate locks in the resource group.
-        Only works if locks were previously deleted.
+        Recreate the locks that release_locks deleted, including after a partial release.
         """
         try:
-            if not self.lock_objs:
-                print("No locks to recreate")
+            # Checked first so a locker that never released anything doesn't list locks
+            if not self.released:
+                logger.info("No locks were released, skipping recreation")
                 return
 
-            if not self.deleted:
-                print("Locks were not deleted, skipping recreation")
-                return
-
-            for lock in self.lock_objs:
-                self.lock_client.management_locks.create_or_update_at_resource_group_level(
-                    resource_group_name=self.resource_group_name,
-                    lock_name=lock.name,
-                    parameters={"level": lock.level, "notes": lock.notes},
-                )
-                print(f"Reset lock: {lock.name}")
+            locks = [self.locks_by_name[name] for name in self.released]
+            failed = []
+            max_workers = min(self.MAX_WORKERS, len(locks))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._put_lock, lock.name, lock.level, lock.notes): lock
+                    for lock in locks
+                }
+                for future in as_completed(futures):
+                    lock = futures[future]
+                    try:
+                        future.result()
+                        self.released.discard(lock.name)
+                        logger.info("Reset lock: %s", lock.name)
+                    except Exception as e:
+                        logger.error("Error recreating lock %s: %s", lock.name, e)
+                        failed.append(lock.name)
+
+            if failed:
+                raise RuntimeError(f"Failed to recreate locks: {', '.join(failed)}")
+            self.deleted = False
 
         except Exception as e:
-            print(f"Error recreating resource locks: {str(e)}")
+            logger.error("Error recreating resource locks: %s", e)
             raise
 
     def create_lock(
@@ -775,39 +1203,81 @@ class AzureResourceLock(AzureResourceBase):
             notes: Optional notes about the lock
         """
         try:
-            if level not in ["CanNotDelete", "ReadOnly"]:
+            if level not in self.LOCK_LEVELS:
                 raise ValueError(
                     "Lock level must be either 'CanNotDelete' or 'ReadOnly'"
                 )
 
             # Check if lock already exists
-            for lock in self.lock_objs:
-                if lock.name == lock_name:
-                    print(f"Lock {lock_name} already exists")
-                    return
+            if lock_name in self.locks_by_name:
+                logger.info("Lock %s already exists", lock_name)
+                return
 
             # Create the lock
-            self.lock_client.management_locks.create_or_update_at_resource_group_level(
-                resource_group_name=self.resource_group_name,
-                lock_name=lock_name,
-                parameters={"level": level, "notes": notes},
-            )
-            print(f"Created lock: {lock_name} with level {level}")
+            self._put_lock(lock_name, level, notes)
+            logger.info("Created lock: %s with level %s", lock_name, level)
 
-            # Update local lock objects
-            self.lock_objs = self.get_locks()
+            # Track the new lock locally instead of listing the resource group again
+            self._locks[lock_name] = SimpleNamespace(name=lock_name, level=level, notes=notes)
 
         except Exception as e:
-            print(f"Error creating resource lock: {str(e)}")
+            logger.error("Error creating resource lock: %s", e)
             raise
 
 
+# (action, current runtime state) -> (poller method, progress verb, result) for
+# the transitions that need an operation; any other valid pair is already done
+_TRIGGER_OPS = {
+    ("stop", "Started"): ("begin_stop", "Stopping", "stopped"),
+    ("start", "Stopped"): ("begin_start", "Starting", "started"),
+}
+
+
+def _validate_trigger_action(action: str) -> None:
+    if action not in ("start", "stop"):
+        raise ValueError(f"Invalid action: {action}. Must be 'start' or 'stop'")
+
+
 class ADFTrigger(AzureResourceBase):
     # Valid trigger types in Azure Data Factory
-    VALID_TRIGGER_TYPES = {
-        "TumblingWindowTrigger",
-        "ScheduleTrigger",
-    }
+    VALID_TRIGGER_TYPES = frozenset(
+        {
+            "TumblingWindowTrigger",
+            "ScheduleTrigger",
+        }
+    )
+    _VALID_TRIGGER_TYPES_TEXT = ", ".join(sorted(VALID_TRIGGER_TYPES))
+    # Seconds between LRO status polls when the service sends no Retry-After;
+    # trigger start/stop finishes in seconds, well under the SDK's 30s default
+    POLLING_INTERVAL = 2
+
+    def iter_triggers(self, trigger_type: str = None) -> Iterator:
+        """
+        Lazily iterate triggers in the Data Factory, optionally filtered by type.
+        Pages are only fetched as the caller consumes the iterator.
+        
+        Args:
+            trigger_type: Optional trigger type to filter by. Must be one of:
+                - TumblingWindowTrigger
+                - ScheduleTrigger
+            
+        Returns:
+            Iterator of trigger objects; Schedule and TumblingWindow triggers by default
+            
+        Raises:
+            ValueError: If an invalid trigger type is specified
+        """
+        if trigger_type and trigger_type not in self.VALID_TRIGGER_TYPES:
+            raise ValueError(
+                f"Invalid trigger type: {trigger_type}. "
+                f"Must be one of: {self._VALID_TRIGGER_TYPES_TEXT}"
+            )
+
+        valid = frozenset((trigger_type,)) if trigger_type else self.VALID_TRIGGER_TYPES
+        triggers = self.client.triggers.list_by_factory(
+            self.resource_group_name, self.resource_name
+        )
+        return (trigger for trigger in triggers if trigger.properties.type in valid)
 
     def list_triggers(self, trigger_type: str = None) -> List:
         """
@@ -826,79 +1296,75 @@ class ADFTrigger(AzureResourceBase):
             ValueError: If an invalid trigger type is specified
         """
         try:
-            if trigger_type and trigger_type not in self.VALID_TRIGGER_TYPES:
-                raise ValueError(
-                    f"Invalid trigger type: {trigger_type}. "
-                    f"Must be one of: {', '.join(sorted(self.VALID_TRIGGER_TYPES))}"
-                )
-
-            print(f"Listing all triggers in the Data Factory: {self.resource_name}")
-            triggers = self.client.triggers.list_by_factory(
-                self.resource_group_name, self.resource_name
+            logger.info(
+                "Listing all triggers in the Data Factory: %s", self.resource_name
             )
+            filtered_triggers = list(self.iter_triggers(trigger_type))
 
-            # Convert ItemPaged to list and filter
-            trigger_list = list(triggers)
-
-            # Filter by specific type if provided, otherwise only show schedule and tumbling
             if trigger_type:
-                filtered_triggers = [
-                    trigger
-                    for trigger in trigger_list
-                    if trigger.properties.type == trigger_type
-                ]
-                print(f"Found {len(filtered_triggers)} {trigger_type} triggers")
-                return filtered_triggers
+                logger.info(
+                    "Found %s %s triggers", len(filtered_triggers), trigger_type
+                )
             else:
-                filtered_triggers = [
-                    trigger
-                    for trigger in trigger_list
-                    if trigger.properties.type in self.VALID_TRIGGER_TYPES
-                ]
-                print(f"Found {len(filtered_triggers)} schedule/tumbling triggers")
-                return filtered_triggers
+                logger.info(
+                    "Found %s schedule/tumbling triggers", len(filtered_triggers)
+                )
+            return filtered_triggers
 
         except Exception as e:
-            print(f"Error listing triggers: {str(e)}")
+            logger.error("Error listing triggers: %s", e)
             raise
 
-    def manage_trigger(self, trigger_name: str, action: str) -> None:
+    async def list_triggers_async(self, trigger_type: str = None) -> List:
+        """Async version of list_triggers; the SDK call runs in a worker thread"""
+        return await asyncio.to_thread(self.list_triggers, trigger_type)
+
+    def manage_trigger(self, trigger_name: str, action: str, wait: bool = True):
         """
         Manage a specific trigger (start/stop).
         
         Args:
             trigger_name: Name of the trigger to manage
             action: Action to perform ('start' or 'stop')
+            wait: If False, return the LRO poller right after the operation is
+                submitted instead of blocking until it completes
+                
+        Returns:
+            The LRO poller when wait is False and an operation was submitted, otherwise None
         """
         try:
+            _validate_trigger_action(action)
             trigger_obj = self.client.triggers.get(
                 self.resource_group_name, self.resource_name, trigger_name
             )
-            print(f"Current trigger state: {trigger_obj.properties.runtime_state}")
+            logger.info(
+                "Current trigger state: %s", trigger_obj.properties.runtime_state
+            )
 
-            if action == "stop" and trigger_obj.properties.runtime_state == "Started":
-                print(f"Stopping trigger: {trigger_name}")
-                operation = self.client.triggers.begin_stop(
-                    self.resource_group_name, self.resource_name, trigger_name
-                )
-                operation.wait()
-                print(f"Trigger {trigger_name} stopped")
-            elif (
-                action == "start" and trigger_obj.properties.runtime_state == "Stopped"
-            ):
-                print(f"Starting trigger: {trigger_name}")
-                operation = self.client.triggers.begin_start(
-                    self.resource_group_name, self.resource_name, trigger_name
-                )
-                operation.wait()
-                print(f"Trigger {trigger_name} started")
-            else:
-                print(
-                    f"Trigger {trigger_name} is already in the desired state, skipping {action}"
+            op = _TRIGGER_OPS.get((action, trigger_obj.properties.runtime_state))
+            if op is None:
+                logger.info(
+                    "Trigger %s is already in the desired state, skipping %s",
+                    trigger_name,
+                    action,
                 )
+                return
+
+            method_name, progress, done = op
+            logger.info("%s trigger: %s", progress, trigger_name)
+            operation = getattr(self.client.triggers, method_name)(
+                self.resource_group_name,
+                self.resource_name,
+                trigger_name,
+                polling_interval=self.POLLING_INTERVAL,
+            )
+            if not wait:
+                return operation
+            operation.wait()
+            logger.info("Trigger %s %s", trigger_name, done)
 
         except Exception as e:
-            print(f"Error managing trigger {trigger_name}: {str(e)}")
+            logger.error("Error managing trigger %s: %s", trigger_name, e)
             raise
 
     def manage_all_triggers(self, action: str) -> None:
@@ -909,19 +1375,59 @@ class ADFTrigger(AzureResourceBase):
             action: Action to perform ('start' or 'stop')
         """
         try:
-            print(
-                f"Managing all triggers in Data Factory: {self.resource_name} with action: {action}"
+            _validate_trigger_action(action)
+            logger.info(
+                "Managing all triggers in Data Factory: %s with action: %s",
+                self.resource_name,
+                action,
             )
             triggers = self.list_triggers()
+            if not triggers:
+                return
 
-            for trigger in triggers:
-                print(
-                    f"Working on {trigger.name} under {self.resource_group_name}/{self.resource_name}..."
-                )
-                self.manage_trigger(trigger.name, action)
+            # Submit every start/stop first so the LROs progress server-side together
+            pollers = {}
+            with ThreadPoolExecutor(max_workers=min(16, len(triggers))) as executor:
+                futures = {}
+                for trigger in triggers:
+                    logger.info(
+                        "Working on %s under %s/%s...",
+                        trigger.name,
+                        self.resource_group_name,
+                        self.resource_name,
+                    )
+                    futures[
+                        executor.submit(
+                            self.manage_trigger, trigger.name, action, wait=False
+                        )
+                    ] = trigger.name
+
+                # A failed submission must not abandon the operations already started
+                failed = []
+                for future in as_completed(futures):
+                    trigger_name = futures[future]
+                    try:
+                        poller = future.result()
+                    except Exception as e:
+                        failed.append(f"{trigger_name} ({e})")
+                        continue
+                    if poller is not None:
+                        pollers[trigger_name] = poller
+
+            # Then join every operation that was started
+            for trigger_name, poller in pollers.items():
+                try:
+                    poller.result()
+                    logger.info("Finished %s for trigger %s", action, trigger_name)
+                except Exception as e:
+                    logger.error("Error finishing %s for trigger %s: %s", action, trigger_name, e)
+                    failed.append(f"{trigger_name} ({e})")
+
+            if failed:
+                raise RuntimeError(f"Failed to {action} triggers: {', '.join(failed)}")
 
         except Exception as e:
-            print(f"Error managing all triggers: {str(e)}")
+            logger.error("Error managing all triggers: %s", e)
             raise
 
     def reset_tumbling_with_start_time(
@@ -971,11 +1477,11 @@ class ADFTrigger(AzureResourceBase):
 
             # Stop the trigger if it's running
             if original_state == "Started":
-                print(f"Stopping trigger {trigger_name} before recreation...")
+                logger.info("Stopping trigger %s before recreation...", trigger_name)
                 self.manage_trigger(trigger_name, "stop")
 
             # Delete the trigger
-            print(f"Deleting trigger {trigger_name}... temporarily")
+            logger.info("Deleting trigger %s... temporarily", trigger_name)
             self.client.triggers.delete(
                 self.resource_group_name, self.resource_name, trigger_name
             )
@@ -984,28 +1490,34 @@ class ADFTrigger(AzureResourceBase):
             trigger_properties.start_time = new_start_time
 
             # Recreate the trigger with updated start time
-            print(f"Recreating trigger {trigger_name} with new start time...")
+            logger.info("Recreating trigger %s with new start time...", trigger_name)
             self.client.triggers.create_or_update(
                 self.resource_group_name, self.resource_name, trigger_name, trigger_obj
             )
 
             # Restore original state if it was running
             if original_state == "Started":
-                print(f"Restoring trigger {trigger_name} to running state...")
+                logger.info("Restoring trigger %s to running state...", trigger_name)
                 self.manage_trigger(trigger_name, "start")
 
-            print(
-                f"Successfully reset start time for trigger {trigger_name} to {new_start_time}"
+            logger.info(
+                "Successfully reset start time for trigger %s to %s",
+                trigger_name,
+                new_start_time,
             )
 
         except Exception as e:
-            print(f"Error resetting trigger start time: {str(e)}")
+            logger.error("Error resetting trigger start time: %s", e)
             raise
 
 
 class ADFPipeline(AzureResourceBase):
     def __init__(
-        self, resource_group_name: str, resource_name: str, subscription_id: str = None
+        self,
+        resource_group_name: str,
+        resource_name: str,
+        subscription_id: str = None,
+        credential: DefaultAzureCredential = None,
     ):
         """
         Initialize Azure Data Factory Pipeline operations.
@@ -1014,14 +1526,19 @@ class ADFPipeline(AzureResourceBase):
             resource_group_name: Name of the resource group
             resource_name: Name of the ADF factory
             subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
+            credential: Optional credential. Defaults to the shared process-wide credential
         """
         super().__init__(
             resource_group_name=resource_group_name,
             resource_name=resource_name,
             resource_type="adf",
             subscription_id=subscription_id,
+            credential=credential,
         )
         self.run_id = None
+        # run_id -> (fetched_at, status dict); see check_status
+        self._status_cache = {}
+        self._status_cache_ttl = 2.0
 
     def create_run(self, pipeline_name: str, parameters: Dict = None) -> str:
         """
@@ -1035,7 +1552,7 @@ class ADFPipeline(AzureResourceBase):
             Pipeline run ID as a string
         """
         try:
-            print(f"Starting pipeline: {pipeline_name}")
+            logger.info("Starting pipeline: %s", pipeline_name)
 
             # Prepare parameters if provided
             pipeline_parameters = parameters or {}
@@ -1048,18 +1565,25 @@ class ADFPipeline(AzureResourceBase):
                 parameters=pipeline_parameters,
             )
 
+            self._status_cache.pop(self.run_id, None)
             self.run_id = run_response.run_id
-            print(f"Pipeline {pipeline_name} started with run ID: {self.run_id}")
+            logger.info(
+                "Pipeline %s started with run ID: %s", pipeline_name, self.run_id
+            )
             return self.run_id
 
         except Exception as e:
-            print(f"Error starting pipeline {pipeline_name}: {str(e)}")
+            logger.error("Error starting pipeline %s: %s", pipeline_name, e)
             raise
 
-    def check_status(self) -> Dict:
+    def check_status(self, force: bool = False) -> Dict:
         """
         Check the status of the current pipeline run.
+        A status fetched within the last few seconds is reused unless force is set.
         
+        Args:
+            force: If True, always query the service instead of the short-lived cache
+            
         Returns:
             Dictionary containing pipeline run details including status
         """
@@ -1067,23 +1591,47 @@ class ADFPipeline(AzureResourceBase):
             if not self.run_id:
                 raise ValueError("No active pipeline run. Call create_run() first.")
 
+            cached = self._status_cache.get(self.run_id)
+            if (
+                not force
+                and cached is not None
+                and time.monotonic() - cached[0] < self._status_cache_ttl
+            ):
+                return cached[1]
+
             run_details = self.client.pipeline_runs.get(
                 resource_group_name=self.resource_group_name,
                 factory_name=self.resource_name,
                 run_id=self.run_id,
-            )
-            return run_details.as_dict()
+            ).as_dict()
+            self._status_cache[self.run_id] = (time.monotonic(), run_details)
+            return run_details
 
         except Exception as e:
-            print(f"Error getting pipeline run status for {self.run_id}: {str(e)}")
+            logger.error("Error getting pipeline run status for %s: %s", self.run_id, e)
             raise
 
-    def fetch_activity(self, activity_name: str = None) -> Union[Dict, List[Dict]]:
+    @staticmethod
+    def _run_window(status_result: Dict) -> Tuple:
+        """
+        Read the run start and end time from pipeline run details.
+        Accepts both the older SDK's as_dict() keys and the camelCase keys newer
+        azure-mgmt-datafactory versions return; a run still in progress has no end.
+        """
+        run_start = status_result.get("run_start") or status_result.get("runStart")
+        run_end = status_result.get("run_end") or status_result.get("runEnd")
+        return run_start, run_end or _FAR_FUTURE
+
+    def fetch_activity(
+        self, activity_name: str = None, status_result: Dict = None
+    ) -> Union[Dict, List[Dict]]:
         """
         Fetch activity results after pipeline run is successful.
         
         Args:
             activity_name: Optional specific activity name. If None, returns all activities.
+            status_result: Optional run details already returned by check_status(); when
+                given, the run status is not fetched again
             
         Returns:
             Dictionary for specific activity or List of dictionaries for all activities
@@ -1093,53 +1641,69 @@ class ADFPipeline(AzureResourceBase):
                 raise ValueError("No active pipeline run. Call create_run() first.")
 
             # Check if pipeline is successful
-            status_result = self.check_status()
+            if status_result is None:
+                status_result = self.check_status()
             if status_result.get("status") != "Succeeded":
-                print(
-                    f"Warning: Pipeline status is {status_result.get('status')}, not 'Succeeded'"
+                logger.warning(
+                    "Pipeline status is %s, not 'Succeeded'",
+                    status_result.get("status"),
                 )
 
             # Get pipeline run details to get timing
-            run_start = status_result.get("runStart")
-            run_end = status_result.get("runEnd") or datetime.utcnow().isoformat() + "Z"
-
-            # Query activity runs
-            activity_runs = self.client.activity_runs.query_by_pipeline_run(
-                resource_group_name=self.resource_group_name,
-                factory_name=self.resource_name,
-                run_id=self.run_id,
-                filter_parameters={
-                    "lastUpdatedAfter": run_start,
-                    "lastUpdatedBefore": run_end,
-                },
-            )
+            run_start, run_end = self._run_window(status_result)
 
-            activities_list = [run.as_dict() for run in activity_runs.value]
+            filter_parameters = {
+                "lastUpdatedAfter": run_start,
+                "lastUpdatedBefore": run_end,
+            }
 
             # Return all activities if no specific name provided
             if activity_name is None:
-                print(f"Retrieved {len(activities_list)} activities")
+                activities_list = [
+                    run.as_dict()
+                    for run in self._iter_activity_runs(filter_parameters)
+                ]
+                logger.info("Retrieved %s activities", len(activities_list))
                 return activities_list
 
-            # Find specific activity
-            for activity in activities_list:
-                if activity.get("activityName") == activity_name:
-                    print(
-                        f"Found activity {activity_name} with status: {activity.get('status')}"
+            # Find specific activity, stopping at the first match
+            available_activities = []
+            for run in self._iter_activity_runs(filter_parameters):
+                name = run.activity_name
+                if name == activity_name:
+                    logger.info(
+                        "Found activity %s with status: %s", activity_name, run.status
                     )
-                    return activity
+                    return run.as_dict()
+                available_activities.append(name)
 
             # Activity not found
-            available_activities = [act.get("activityName") for act in activities_list]
             raise ValueError(
                 f"Activity '{activity_name}' not found. "
                 f"Available activities: {available_activities}"
             )
 
         except Exception as e:
-            print(f"Error fetching activity results: {str(e)}")
+            logger.error("Error fetching activity results: %s", e)
             raise
 
+    def _iter_activity_runs(self, filter_parameters: Dict) -> Iterator:
+        """
+        Iterate activity runs of the current pipeline run, following continuation tokens.
+        """
+        filter_parameters = dict(filter_parameters)
+        while True:
+            response = self.client.activity_runs.query_by_pipeline_run(
+                resource_group_name=self.resource_group_name,
+                factory_name=self.resource_name,
+                run_id=self.run_id,
+                filter_parameters=filter_parameters,
+            )
+            yield from response.value
+            if not response.continuation_token:
+                return
+            filter_parameters["continuationToken"] = response.continuation_token
+
     def run_and_fetch(
         self, pipeline_name: str, activity_name: str = None, parameters: Dict = None
     ) -> Union[Dict, List[Dict]]:
@@ -1159,11 +1723,11 @@ class ADFPipeline(AzureResourceBase):
             self.create_run(pipeline_name, parameters)
 
             # Wait for completion
-            print("Waiting for pipeline to complete...")
+            logger.info("Waiting for pipeline to complete...")
             while True:
-                status_result = self.check_status()
+                status_result = self.check_status(force=True)
                 status = status_result.get("status")
-                print(f"Pipeline status: {status}")
+                logger.info("Pipeline %s status: %s", self.run_id, status)
 
                 if status in ["Succeeded", "Failed", "Cancelled"]:
                     break
@@ -1172,13 +1736,95 @@ class ADFPipeline(AzureResourceBase):
 
             # Fetch activity results
             if status == "Succeeded":
-                return self.fetch_activity(activity_name)
+                return self.fetch_activity(activity_name, status_result=status_result)
             else:
                 raise Exception(f"Pipeline failed with status: {status}")
 
         except Exception as e:
-            print(f"Error in run_and_fetch: {str(e)}")
+            logger.error("Error in run_and_fetch: %s", e)
             raise
 
+    async def run_and_fetch_async(
+        self,
+        pipeline_name: str,
+        activity_name: str = None,
+        parameters: Dict = None,
+        poll_interval: int = 30,
+    ) -> Union[Dict, List[Dict]]:
+        """
+        Async version of run_and_fetch.
+
+        The SDK calls run in a worker thread and the wait between status
+        checks is an asyncio sleep, so many pipeline runs can be supervised
+        from a single event loop (see gather_pipelines).
+
+        Args:
+            pipeline_name: Name of the pipeline to run
+            activity_name: Optional specific activity name. If None, returns all activities.
+            parameters: Optional dictionary of parameters to pass to the pipeline
+            poll_interval: Seconds to wait between status checks
+
+        Returns:
+            Dictionary for specific activity or List of dictionaries for all activities
+        """
+        try:
+            # Create and run pipeline
+            await asyncio.to_thread(self.create_run, pipeline_name, parameters)
+
+            # Wait for completion
+            logger.info("Waiting for pipeline %s to complete...", pipeline_name)
+            while True:
+                status_result = await asyncio.to_thread(self.check_status, True)
+                status = status_result.get("status")
+                logger.info("Pipeline %s status: %s", pipeline_name, status)
+
+                if status in ["Succeeded", "Failed", "Cancelled"]:
+                    break
+
+                await asyncio.sleep(poll_interval)
+
+            # Fetch activity results
+            if status == "Succeeded":
+                return await asyncio.to_thread(
+                    self.fetch_activity, activity_name, status_result
+                )
+            else:
+                raise Exception(f"Pipeline failed with status: {status}")
+
+        except Exception as e:
+            logger.error("Error in run_and_fetch_async: %s", e)
+            raise
+
+
+async def gather_pipelines(
+    cases: List[Tuple[ADFPipeline, str, str, Dict]], poll_interval: int = 30
+) -> List[Union[Dict, List[Dict], Exception]]:
+    """
+    Run several pipelines concurrently and collect their activity results.
+
+    Args:
+        cases: List of (pipeline_runner, pipeline_name, activity_name, parameters)
+            tuples. Each runner should be its own ADFPipeline instance since the
+            run ID is tracked per instance.
+        poll_interval: Seconds to wait between status checks
+
+    Returns:
+        List of results in the same order as cases. A failed run yields its
+        exception instead of cancelling the other runs.
+    """
+    return await asyncio.gather(
+        *(
+            runner.run_and_fetch_async(
+                pipeline_name=pipeline_name,
+                activity_name=activity_name,
+                parameters=parameters,
+                poll_interval=poll_interval,
+            )
+            for runner, pipeline_name, activity_name, parameters in cases
+        ),
+        return_exceptions=True,
+    )
+
 
 # %%
+
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 import json
+import asyncio
+import sys
+import logging
 import argparse
 from typing import List, Dict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from AzHelper import ADFPipeline
+from AzHelper import ADFPipeline, gather_pipelines
+from build import load_build_section
 
 def get_adf_configs(file_path: str = "build.json") -> List[Dict]:
     """
@@ -15,17 +19,8 @@ def get_adf_configs(file_path: str = "build.json") -> List[Dict]:
     Returns:
         List of ADF configurations
     """
-    try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            
-        if not isinstance(data.get("ADFLinkedServiceFQDN"), list):
-            # Handle single domain case
-            return [data["ADFLinkedServiceFQDN"]]
-        return data["ADFLinkedServiceFQDN"]
-    except Exception as e:
-        print(f"Error reading or processing build.json: {str(e)}")
-        raise
+    entries, _ = load_build_section(file_path, "ADFLinkedServiceFQDN")
+    return entries
 
 def run_connectivity_tests(config_file: str, parameters: Dict = None) -> None:
     """
@@ -45,53 +40,56 @@ def run_connectivity_tests(config_file: str, parameters: Dict = None) -> None:
     # Track results across all ADFs
     all_results = {}
 
-    # Process each ADF
+    # One runner per ADF, since each tracks its own run ID
+    cases = []
     for adf_config in adf_configs:
         resource_group = adf_config['resourceGroup']
         factory_name = adf_config['adf']
         
         print(f"\nProcessing ADF: {factory_name} in Resource Group: {resource_group}")
-        print("=" * 80)
+        print(f"Running connectivity test pipeline: {pipeline_name}")
         
         # Initialize ADFPipeline
         pipeline_runner = ADFPipeline(
             resource_group_name=resource_group,
             resource_name=factory_name
         )
+        cases.append((pipeline_runner, pipeline_name, activity_name, parameters))
 
-        try:
-            print(f"Running connectivity test pipeline: {pipeline_name}")
-            
-            # Run pipeline and fetch specific activity result
-            activity_result = pipeline_runner.run_and_fetch(
-                pipeline_name=pipeline_name,
-                activity_name=activity_name,
-                parameters=parameters
-            )
-            
-            # Store result for this ADF
-            all_results[f"{resource_group}/{factory_name}"] = {
-                'status': 'success',
-                'run_id': pipeline_runner.run_id,
-                'activity_result': activity_result
-            }
-            
-            # Print summary for this ADF
-            print(f"\n Connectivity test completed successfully")
-            print(f"Run ID: {pipeline_runner.run_id}")
-            print(f"Activity Status: {activity_result.get('status', 'Unknown')}")
-            
-            # Print activity output if available
-            if 'output' in activity_result:
-                print(f"Activity Output: {json.dumps(activity_result['output'], indent=2)}")
-            
-        except Exception as e:
-            print(f" Error running connectivity test in {factory_name}: {str(e)}")
+    # Run the pipelines side by side; each run mostly waits on ADF
+    results = asyncio.run(gather_pipelines(cases))
+
+    for (pipeline_runner, _, _, _), activity_result in zip(cases, results):
+        resource_group = pipeline_runner.resource_group_name
+        factory_name = pipeline_runner.resource_name
+        
+        print(f"\nResult for ADF: {factory_name} in Resource Group: {resource_group}")
+        print("=" * 80)
+
+        if isinstance(activity_result, Exception):
+            print(f" Error running connectivity test in {factory_name}: {str(activity_result)}")
             all_results[f"{resource_group}/{factory_name}"] = {
                 'status': 'error',
-                'error': str(e),
+                'error': str(activity_result),
                 'run_id': getattr(pipeline_runner, 'run_id', None)
             }
+            continue
+
+        # Store result for this ADF
+        all_results[f"{resource_group}/{factory_name}"] = {
+            'status': 'success',
+            'run_id': pipeline_runner.run_id,
+            'activity_result': activity_result
+        }
+        
+        # Print summary for this ADF
+        print(f"\n Connectivity test completed successfully")
+        print(f"Run ID: {pipeline_runner.run_id}")
+        print(f"Activity Status: {activity_result.get('status', 'Unknown')}")
+        
+        # Print activity output if available
+        if 'output' in activity_result:
+            print(f"Activity Output: {json.dumps(activity_result['output'], indent=2)}")
     
     # Print overall summary
     print("\n" + "=" * 80)
@@ -123,6 +121,8 @@ def main():
 
     args = parser.parse_args()
 
+    # AzHelper reports progress through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     # Run in single ADF mode or batch mode
     run_connectivity_tests(
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
-import json
+import sys
+import logging
 import argparse
 from typing import Dict, List, Tuple
 from AzHelper import AzureBatchPool
+from build import load_build_section
 
 
 def get_batch_scale_configs(file_path: str = "build.json") -> List[Dict]:
@@ -15,17 +17,8 @@ def get_batch_scale_configs(file_path: str = "build.json") -> List[Dict]:
     Returns:
         List of batch scale configurations
     """
-    try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            
-        if not isinstance(data.get("batchAccountScale"), list):
-            # Handle single domain case
-            return [data["batchAccountScale"]]
-        return data["batchAccountScale"]
-    except Exception as e:
-        print(f"Error reading or processing build.json: {str(e)}")
-        raise
+    entries, _ = load_build_section(file_path, "batchAccountScale")
+    return entries
 
 def scale_batch_pools(config_file: str, dry_run: bool = True) -> None:
     """
@@ -54,8 +47,8 @@ def scale_batch_pools(config_file: str, dry_run: bool = True) -> None:
             )
             
             # Get current node count from scale down pool
-            scale_down_config = scale_down_pool.get_pool_config()
-            current_nodes = scale_down_config.get('scaleSettings', {}).get('fixedScale', {}).get('targetDedicatedNodes', 0)
+            scale_down_pool.get_pool_config()
+            current_nodes = scale_down_pool.current_nodes
             
             print(f"\nProcessing scale down for {batch_config['scaleDown']['pool']} and scale up for {batch_config['scaleUp']['pool']}")
             print(f"Current node count in scale down pool: {current_nodes}")
@@ -81,6 +74,9 @@ def main():
                       help='Set to True for dry run (default) or False to execute changes')
     args = parser.parse_args()
 
+    # AzHelper reports progress through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     print("Configuration:")
     print(f"Config file: {args.config}")
     print(f"Mode: {'Execute' if args.dry_run == 'False' else 'Dry Run'}\n")
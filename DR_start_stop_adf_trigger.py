@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
-import json
+import asyncio
+import sys
+import logging
 import argparse
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import datetime
 from AzHelper import ADFTrigger, AzureResourceLock
+from build import load_build_section
 
 def get_adf_trigger_configs(file_path: str = "build.json") -> List[Dict]:
     """
@@ -15,17 +18,24 @@ def get_adf_trigger_configs(file_path: str = "build.json") -> List[Dict]:
     Returns:
         List of ADF trigger configurations
     """
-    try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            
-        if not isinstance(data.get("ADFTrigger"), list):
-            # Handle single domain case
-            return [data["ADFTrigger"]]
-        return data["ADFTrigger"]
-    except Exception as e:
-        print(f"Error reading or processing build.json: {str(e)}")
-        raise
+    entries, _ = load_build_section(file_path, "ADFTrigger")
+    return entries
+
+async def list_locks_and_triggers(lock_mgr: AzureResourceLock, trigger_mgr: ADFTrigger) -> Tuple[List, List]:
+    """
+    List the resource group's locks and the factory's triggers concurrently.
+    
+    Args:
+        lock_mgr: Lock manager for the resource group
+        trigger_mgr: Trigger manager for the factory
+        
+    Returns:
+        Tuple of (locks, triggers)
+    """
+    locks, triggers = await asyncio.gather(
+        lock_mgr.get_locks_async(), trigger_mgr.list_triggers_async()
+    )
+    return locks, triggers
 
 def manage_adf_triggers(config_file: str, action: str, dry_run: bool = True, start_time: datetime = None) -> None:
     """
@@ -48,43 +58,48 @@ def manage_adf_triggers(config_file: str, action: str, dry_run: bool = True, sta
             # Get the appropriate ADF configuration based on action
             adf_config = config[action]
             resource_group = adf_config["resourceGroup"]
+            factory_name = adf_config["adf"]
             
-            # Check and handle resource locks only if not in dry run mode
             lock_mgr = None
             locks = None
-            if not dry_run:
-                lock_mgr = AzureResourceLock(resource_group_name=resource_group)
-                locks = lock_mgr.get_locks()
-                if locks:
-                    print(f"Found {len(locks)} locks in resource group {resource_group}")
-                    print(f"Temporarily releasing {len(locks)} locks...")
-                    lock_mgr.release_locks()
             
             # Initialize ADF trigger manager
             trigger_mgr = ADFTrigger(
                 resource_group_name=resource_group,
-                resource_name=adf_config["adf"]
+                resource_name=factory_name
             )
             
-            print(f"\nProcessing ADF triggers for {adf_config['adf']} in {resource_group}")
+            print(f"\nProcessing ADF triggers for {factory_name} in {resource_group}")
             
-            # Get all triggers
-            triggers = trigger_mgr.list_triggers()
+            # Get all triggers, and the resource locks only if not in dry run mode
+            if dry_run:
+                triggers = trigger_mgr.list_triggers()
+            else:
+                lock_mgr = AzureResourceLock(resource_group_name=resource_group)
+                lock_mgr.lock_objs, triggers = asyncio.run(
+                    list_locks_and_triggers(lock_mgr, trigger_mgr)
+                )
             if not triggers:
-                print(f"No triggers found in ADF {adf_config['adf']}")
+                print(f"No triggers found in ADF {factory_name}")
                 continue
             
             print(f"Found {len(triggers)} triggers")
             
             if dry_run:
-                print(f"What if: Would {action} all triggers in {adf_config['adf']}")
+                print(f"What if: Would {action} all triggers in {factory_name}")
                 if action == "start":
                     print(f"What if: Would reset all tumbling triggers to start at {start_time}")
                 continue
             
+            locks = lock_mgr.lock_objs
+            if locks:
+                print(f"Found {len(locks)} locks in resource group {resource_group}")
+                print(f"Temporarily releasing {len(locks)} locks...")
+                lock_mgr.release_locks()
+            
             # Manage triggers
             trigger_mgr.manage_all_triggers(action)
-            print(f"Successfully {action}ed all triggers in {adf_config['adf']}")
+            print(f"Successfully {action}ed all triggers in {factory_name}")
             
             # If action is start, reset tumbling triggers
             if action == "start":
@@ -103,13 +118,13 @@ def manage_adf_triggers(config_file: str, action: str, dry_run: bool = True, sta
             
             # Verify triggers state
             current_triggers = trigger_mgr.list_triggers()
+            expected_state = "Started" if action == "start" else "Stopped"
             for trigger in current_triggers:
                 trigger_obj = trigger_mgr.client.triggers.get(
                     trigger_mgr.resource_group_name,
                     trigger_mgr.resource_name,
                     trigger.name
                 )
-                expected_state = "Started" if action == "start" else "Stopped"
                 if trigger_obj.properties.runtime_state != expected_state:
                     print(f"Warning: Trigger {trigger.name} is not {expected_state.lower()}")
             
@@ -119,7 +134,7 @@ def manage_adf_triggers(config_file: str, action: str, dry_run: bool = True, sta
                 lock_mgr.recreate_locks()
                     
         except Exception as e:
-            print(f"Error processing ADF {adf_config['adf']}: {str(e)}")
+            print(f"Error processing ADF {factory_name}: {str(e)}")
             # Try to recreate locks even if there was an error
             if not dry_run and locks:
                 print(f"Recreating {len(locks)} locks in resource group {resource_group}...")
@@ -138,6 +153,9 @@ def main():
                       help='Start time for tumbling triggers in ISO format (e.g., "2024-03-20T10:00:00")')
     args = parser.parse_args()
 
+    # AzHelper reports progress through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     # Parse start_time if provided
     start_time = None
     if args.start_time:
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
-import json
 import argparse
 from typing import List, Dict, Tuple
 from AzHelper import ADFManagedPrivateEndpoint
+from build import load_build_section
 
 def get_adf_configs_and_mode(file_path: str = "build.json") -> Tuple[List[Dict], str]:
     """
@@ -16,24 +16,8 @@ def get_adf_configs_and_mode(file_path: str = "build.json") -> Tuple[List[Dict],
         - List of ADF configurations
         - Mode ('failover' or 'failback')
     """
-    try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            
-        # Get ADF configurations
-        if not isinstance(data.get("ADFLinkedServiceFQDN"), list):
-            # Handle single domain case
-            adf_configs = [data["ADFLinkedServiceFQDN"]]
-        else:
-            adf_configs = data["ADFLinkedServiceFQDN"]
-            
-        # Get mode
-        mode = data.get("config", {}).get("mode", "failover")
-        
-        return adf_configs, mode
-    except Exception as e:
-        print(f"Error reading or processing build.json: {str(e)}")
-        raise
+    adf_configs, config = load_build_section(file_path, "ADFLinkedServiceFQDN")
+    return adf_configs, config.get("mode", "failover")
 
 def manage_private_endpoints(config_file: str, dry_run: bool = True) -> None:
     """
@@ -54,14 +38,16 @@ def manage_private_endpoints(config_file: str, dry_run: bool = True) -> None:
     print(f"\nMode: {mode}")
     
     for config in adf_configs:
+        resource_group = config["resourceGroup"]
+        factory_name = config["adf"]
         try:
             # Initialize ADF private endpoint manager
             endpoint_mgr = ADFManagedPrivateEndpoint(
-                resource_group_name=config["resourceGroup"],
-                resource_name=config["adf"]
+                resource_group_name=resource_group,
+                resource_name=factory_name
             )
             
-            print(f"\nProcessing ADF private endpoints for {config['adf']} in {config['resourceGroup']}")
+            print(f"\nProcessing ADF private endpoints for {factory_name} in {resource_group}")
             
             # Get current endpoint configurations
             try:
@@ -82,42 +68,42 @@ def manage_private_endpoints(config_file: str, dry_run: bool = True) -> None:
                 # Remove domain from east if present
                 if domain in east_fqdns:
                     if dry_run:
-                        print(f"What if: Would remove {domain} from {mpe_east} in {config['adf']}")
+                        print(f"What if: Would remove {domain} from {mpe_east} in {factory_name}")
                     else:
                         new_fqdns = [fqdn for fqdn in east_fqdns if fqdn != domain]
                         endpoint_mgr.update_managed_private_endpoint_fqdn(mpe_east, new_fqdns)
-                        print(f"Removed {domain} from {mpe_east} in {config['adf']}")
+                        print(f"Removed {domain} from {mpe_east} in {factory_name}")
                 
                 # Add domain to west if not present
                 if domain not in west_fqdns:
                     if dry_run:
-                        print(f"What if: Would add {domain} to {mpe_west} in {config['adf']}")
+                        print(f"What if: Would add {domain} to {mpe_west} in {factory_name}")
                     else:
                         new_fqdns = west_fqdns + [domain]
                         endpoint_mgr.update_managed_private_endpoint_fqdn(mpe_west, new_fqdns)
-                        print(f"Added {domain} to {mpe_west} in {config['adf']}")
+                        print(f"Added {domain} to {mpe_west} in {factory_name}")
                         
             elif mode == "failback":
                 # Remove domain from west if present
                 if domain in west_fqdns:
                     if dry_run:
-                        print(f"What if: Would remove {domain} from {mpe_west} in {config['adf']}")
+                        print(f"What if: Would remove {domain} from {mpe_west} in {factory_name}")
                     else:
                         new_fqdns = [fqdn for fqdn in west_fqdns if fqdn != domain]
                         endpoint_mgr.update_managed_private_endpoint_fqdn(mpe_west, new_fqdns)
-                        print(f"Removed {domain} from {mpe_west} in {config['adf']}")
+                        print(f"Removed {domain} from {mpe_west} in {factory_name}")
                 
                 # Add domain to east if not present
                 if domain not in east_fqdns:
                     if dry_run:
-                        print(f"What if: Would add {domain} to {mpe_east} in {config['adf']}")
+                        print(f"What if: Would add {domain} to {mpe_east} in {factory_name}")
                     else:
                         new_fqdns = east_fqdns + [domain]
                         endpoint_mgr.update_managed_private_endpoint_fqdn(mpe_east, new_fqdns)
-                        print(f"Added {domain} to {mpe_east} in {config['adf']}")
+                        print(f"Added {domain} to {mpe_east} in {factory_name}")
                     
         except Exception as e:
-            print(f"Error processing ADF {config['adf']}: {str(e)}")
+            print(f"Error processing ADF {factory_name}: {str(e)}")
             continue
 
 def main():
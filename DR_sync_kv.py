@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
-import json
+import sys
+import logging
 import argparse
 from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from AzHelper import AzureKeyVault
+from build import load_build_section
 
 def get_kv_sync_configs(file_path: str = "build.json") -> tuple[List[Dict], Dict]:
     """
@@ -16,27 +19,54 @@ def get_kv_sync_configs(file_path: str = "build.json") -> tuple[List[Dict], Dict
         - List of key vault sync configurations
         - Config data dictionary
     """
+    return load_build_section(file_path, "kvSync", required=False)
+
+def sync_secret(source_kv: AzureKeyVault, target_kv: AzureKeyVault, secret_name: str,
+                kv_config: Dict, dry_run: bool = True) -> None:
+    """
+    Copy one secret from the source to the target key vault if the values differ.
+    
+    Args:
+        source_kv: Source key vault client
+        target_kv: Target key vault client
+        secret_name: Name of the secret to copy
+        kv_config: Key vault sync configuration, used for messages
+        dry_run: If True, only show what would be changed without making changes
+    """
+    print(f"\nProcessing secret: {secret_name}")
+    
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            
-        kv_sync = data.get("kvSync", [])
-        if not isinstance(kv_sync, list):
-            # Handle single domain case
-            kv_sync = [kv_sync]
-            
-        return kv_sync, data.get("config", {})
+        # Get secret value from source vault
+        source_value = source_kv.get_secret(secret_name)
+        
+        # Try to get the secret from target vault to compare
+        try:
+            target_value = target_kv.get_secret(secret_name)
+            if source_value == target_value:
+                print(f"Skipping {secret_name} - values are identical")
+                return
+        except Exception:
+            # If secret doesn't exist in target vault, continue with copying
+            pass
+        
+        if dry_run:
+            print(f"What if: Would copy secret {secret_name} from {kv_config['from']['kv']} to {kv_config['to']['kv']}")
+            return
+        
+        # Set secret in target vault
+        target_kv.set_secret(secret_name, source_value)
+        
     except Exception as e:
-        print(f"Error reading or processing build.json: {str(e)}")
-        raise
+        print(f"Error processing secret {secret_name}: {str(e)}")
 
-def sync_key_vaults(config_file: str, dry_run: bool = True) -> None:
+def sync_key_vaults(config_file: str, dry_run: bool = True, max_workers: int = 8) -> None:
     """
     Sync secrets between key vaults based on configuration.
     
     Args:
         config_file: Path to the build.json configuration file
         dry_run: If True, only show what would be changed without making changes
+        max_workers: Maximum number of secrets copied concurrently per vault pair; dry runs use one
     """
     # Get key vault sync configurations and mode
     kv_configs, config = get_kv_sync_configs(config_file)
@@ -68,35 +98,17 @@ def sync_key_vaults(config_file: str, dry_run: bool = True) -> None:
                 print(f"No secrets found in source vault {kv_config['from']['kv']}")
                 continue
             
-            # Copy each secret to target vault
-            for secret in secrets:
-                secret_name = secret['name']
-                print(f"\nProcessing secret: {secret_name}")
-                
-                try:
-                    # Get secret value from source vault
-                    source_value = source_kv.get_secret(secret_name)
-                    
-                    # Try to get the secret from target vault to compare
-                    try:
-                        target_value = target_kv.get_secret(secret_name)
-                        if source_value == target_value:
-                            print(f"Skipping {secret_name} - values are identical")
-                            continue
-                    except Exception:
-                        # If secret doesn't exist in target vault, continue with copying
-                        pass
-                    
-                    if dry_run:
-                        print(f"What if: Would copy secret {secret_name} from {kv_config['from']['kv']} to {kv_config['to']['kv']}")
-                        continue
-                    
-                    # Set secret in target vault
-                    target_kv.set_secret(secret_name, source_value)
-                    
-                except Exception as e:
-                    print(f"Error processing secret {secret_name}: {str(e)}")
-                    continue
+            # Copy secrets to the target vault in parallel; each copy is a few independent REST calls.
+            # Dry runs stay sequential so each secret's report lines stay together.
+            with ThreadPoolExecutor(max_workers=1 if dry_run else max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        sync_secret, source_kv, target_kv, secret['name'], kv_config, dry_run
+                    )
+                    for secret in secrets
+                ]
+                for future in as_completed(futures):
+                    future.result()
                     
         except Exception as e:
             print(f"Error processing key vaults: {str(e)}")
@@ -110,6 +122,9 @@ def main():
                       help='Set to True for dry run (default) or False to execute changes')
     args = parser.parse_args()
 
+    # AzHelper reports progress through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     print("Configuration:")
     print(f"Config file: {args.config}")
     print(f"Mode: {'Execute' if args.dry_run == 'False' else 'Dry Run'}\n")
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
-import json
 import argparse
-from typing import List, Dict
-from AzHelper import ADFLinkedServices
+from typing import List, Dict, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from build import load_build_section
+
+if TYPE_CHECKING:
+    from AzHelper import ADFLinkedServices
 
 def get_adf_configs(file_path: str = "build.json") -> List[Dict]:
     """
@@ -14,19 +17,83 @@ def get_adf_configs(file_path: str = "build.json") -> List[Dict]:
     Returns:
         List of ADF configurations
     """
+    entries, _ = load_build_section(file_path, "ADFLinkedServiceFQDN")
+    return entries
+
+def update_service_fqdn(linked_services: "ADFLinkedServices", service: Dict, old_fqdn: str,
+                        new_fqdn: str, dry_run: bool = True) -> None:
+    """
+    Update the Snowflake FQDN of one linked service, reporting errors instead of raising.
+    
+    Args:
+        linked_services (ADFLinkedServices): Client for the ADF that owns the service
+        service (Dict): REST-shaped linked service definition
+        old_fqdn (str): The old FQDN to replace
+        new_fqdn (str): The new FQDN to use
+        dry_run (bool): If True, only show what would be changed without making changes
+    """
+    service_name = service['name']
+    print(f"\nUpdating Snowflake linked service: {service_name}")
+    
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            
-        if not isinstance(data.get("ADFLinkedServiceFQDN"), list):
-            # Handle single domain case
-            return [data["ADFLinkedServiceFQDN"]]
-        return data["ADFLinkedServiceFQDN"]
+        linked_services.update_linked_service_sf_account(
+            linked_service_name=service_name,
+            old_fqdn=old_fqdn,
+            new_fqdn=new_fqdn,
+            dry_run=dry_run,
+            linked_service=service
+        )
     except Exception as e:
-        print(f"Error reading or processing build.json: {str(e)}")
-        raise
+        print(f"Error updating {service_name}: {str(e)}")
 
-def update_snowflake_fqdns(config_file: str, old_fqdn: str, new_fqdn: str, dry_run: bool = True) -> None:
+def update_adf_fqdns(adf_config: Dict, old_fqdn: str, new_fqdn: str, dry_run: bool = True,
+                     max_workers: int = 4) -> None:
+    """
+    Update Snowflake FQDNs in all Snowflake linked services of one ADF.
+    
+    Args:
+        adf_config (Dict): ADF configuration with 'resourceGroup' and 'adf'
+        old_fqdn (str): The old FQDN to replace
+        new_fqdn (str): The new FQDN to use
+        dry_run (bool): If True, only show what would be changed without making changes
+        max_workers (int): Maximum number of linked services updated concurrently
+    """
+    resource_group = adf_config['resourceGroup']
+    factory_name = adf_config['adf']
+    
+    print(f"\nProcessing ADF: {factory_name} in Resource Group: {resource_group}")
+    
+    # Imported here so --help and builds without linked services skip loading the Azure SDK
+    from AzHelper import ADFLinkedServices
+
+    # Initialize ADFLinkedServices with new structure
+    linked_services = ADFLinkedServices(
+        resource_group_name=resource_group,
+        resource_name=factory_name,
+        resource_type='adf'
+    )
+
+    # Get all Snowflake linked services, in the REST shape the update expects
+    snowflake_services = linked_services.list_linked_services(
+        filter_by_type=['Snowflake','SnowflakeV2'], serialize=True
+    )
+    
+    if not snowflake_services:
+        print(f"No Snowflake linked services found in {factory_name}")
+        return
+
+    # Update the Snowflake linked services side by side. Dry runs print a full
+    # configuration per service, so they stay sequential to keep the report readable.
+    with ThreadPoolExecutor(max_workers=1 if dry_run else max_workers) as executor:
+        futures = [
+            executor.submit(update_service_fqdn, linked_services, service, old_fqdn, new_fqdn, dry_run)
+            for service in snowflake_services
+        ]
+        for future in futures:
+            future.result()
+
+def update_snowflake_fqdns(config_file: str, old_fqdn: str, new_fqdn: str, dry_run: bool = True,
+                           max_workers: int = 8) -> None:
     """
     Update Snowflake FQDNs in ADF linked services based on configuration.
     
@@ -35,45 +102,20 @@ def update_snowflake_fqdns(config_file: str, old_fqdn: str, new_fqdn: str, dry_r
         old_fqdn (str): The old FQDN to replace
         new_fqdn (str): The new FQDN to use
         dry_run (bool): If True, only show what would be changed without making changes
+        max_workers (int): Maximum number of ADFs processed concurrently
     """
     # Get the ADF configurations
     adf_configs = get_adf_configs(config_file)
 
-    # Process each ADF
-    for adf_config in adf_configs:
-        resource_group = adf_config['resourceGroup']
-        factory_name = adf_config['adf']
-        
-        print(f"\nProcessing ADF: {factory_name} in Resource Group: {resource_group}")
-        
-        # Initialize ADFLinkedServices with new structure
-        linked_services = ADFLinkedServices(
-            resource_group_name=resource_group,
-            resource_name=factory_name,
-            resource_type='adf'
-        )
-
-        # Get all Snowflake linked services
-        snowflake_services = linked_services.list_linked_services(filter_by_type=['Snowflake','SnowflakeV2'])
-        
-        if not snowflake_services:
-            print(f"No Snowflake linked services found in {factory_name}")
-            continue
-
-        # Update each Snowflake linked service
-        for service in snowflake_services:
-            service_name = service['name']
-            print(f"\nUpdating Snowflake linked service: {service_name}")
-            
-            try:
-                linked_services.update_linked_service_sf_account(
-                    linked_service_name=service_name,
-                    old_fqdn=old_fqdn,
-                    new_fqdn=new_fqdn,
-                    dry_run=dry_run
-                )
-            except Exception as e:
-                print(f"Error updating {service_name}: {str(e)}")
+    # Process the ADFs in parallel; the work is waiting on Azure REST calls.
+    # Dry runs stay sequential so each ADF's report is printed in one piece.
+    with ThreadPoolExecutor(max_workers=1 if dry_run else max_workers) as executor:
+        futures = [
+            executor.submit(update_adf_fqdns, adf_config, old_fqdn, new_fqdn, dry_run)
+            for adf_config in adf_configs
+        ]
+        for future in futures:
+            future.result()
 
 def main():
     parser = argparse.ArgumentParser(description='Update Snowflake FQDNs in ADF linked services')
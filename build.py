@@ -1,117 +1,230 @@
 import json
-import argparse
-from typing import Dict, List, Union, Optional
+from typing import Dict, List, Union, Optional, NamedTuple, Tuple
+
+try:
+    import orjson
+
+    def to_json(data: Dict) -> bytes:
+        """Serialize the configuration as indented, UTF-8 encoded JSON."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def from_json(text: Union[str, bytes]) -> Dict:
+        """Parse a JSON document."""
+        return orjson.loads(text)
+
+except ImportError:
+
+    def to_json(data: Dict) -> bytes:
+        """Serialize the configuration as indented, UTF-8 encoded JSON."""
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    def from_json(text: Union[str, bytes]) -> Dict:
+        """Parse a JSON document."""
+        return json.loads(text)
+
+ORDERED_DOMAINS = ["Sales", "Finance", "Customer", "Accounting", "Nonedw", "Associates"]
+ADF_DOMAINS = ORDERED_DOMAINS + ["Retail"]  # Include Retail only for ADF operations
+SOURCE_ENVS = ["qa", "prod"]  # Environments that fail over to DR
+ENVS = SOURCE_ENVS + ["DR"]
+
+def load_build_section(file_path: str, section: str, required: bool = True) -> Tuple[List[Dict], Dict]:
+    """
+    Read a generated build.json and return one of its sections as a list.
+    Single-domain builds store a section as one object, "All" builds as a list.
+    A file that does not mention the section at all is not parsed; it yields an
+    empty list and an empty config.
+    
+    Args:
+        file_path: Path to the build.json file
+        section: Top-level key to extract, e.g. "ADFTrigger"
+        required: If False, a missing section yields an empty list instead of a KeyError
+        
+    Returns:
+        Tuple containing:
+        - List of section entries
+        - Config data dictionary
+    """
+    try:
+        # Read bytes: both the key check and orjson work on them without decoding
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+
+        # Cheap check before parsing: builds without the section skip the parse entirely
+        if f'"{section}"'.encode() not in raw:
+            print(f"No {section} section in {file_path}, nothing to do")
+            return [], {}
+
+        data = from_json(raw)
+
+        entries = data[section] if required else data.get(section, [])
+        if not isinstance(entries, list):
+            # Handle single domain case
+            entries = [entries]
+
+        return entries, data.get("config", {})
+    except Exception as e:
+        print(f"Error reading or processing build.json: {str(e)}")
+        raise
+
+# Resource names follow fixed {env}{kind}{domain} patterns, so the maps are generated
+# once at import from one template per kind. They are shared by every call, so
+# callers must not modify them.
+_KINDS = {
+    # map name: (name template, domains that have the resource)
+    "batch_map": ("{env}Batch{domain}", ORDERED_DOMAINS),
+    "pool": ("{env}poolBatch{domain}", ORDERED_DOMAINS),
+    "storage_map": ("{env}Storage{domain}", ORDERED_DOMAINS),
+    "kv_map": ("{env}Kv{domain}", ORDERED_DOMAINS),
+    "adf_map": ("{env}{domain}ADF", ADF_DOMAINS),
+    "rg_map": ("{env}{domain}RG", ADF_DOMAINS)
+}
+
+_MAPS = {
+    kind: {d: {e: template.format(env=e, domain=d) for e in ENVS} for d in domains}
+    for kind, (template, domains) in _KINDS.items()
+}
+# Pool names live under each Batch account's entry
+for _domain, _pools in _MAPS.pop("pool").items():
+    _MAPS["batch_map"][_domain]["pool"] = _pools
+
+BATCH_MAP = _MAPS["batch_map"]
+STORAGE_MAP = _MAPS["storage_map"]
+KV_MAP = _MAPS["kv_map"]
+ADF_MAP = _MAPS["adf_map"]
+RG_MAP = _MAPS["rg_map"]
 
 def create_maps() -> Dict[str, Dict[str, Dict[str, str]]]:
-    """Create the mapping dictionaries for resources."""
-    batch_map = {
-        "Sales": {
-            "qa": "qaBatchSales",
-            "prod": "prodBatchSales",
-            "DR": "DRBatchSales",
-            "pool": {
-                "qa": "qapoolBatchSales",
-                "prod": "prodpoolBatchSales",
-                "DR": "DRpoolBatchSales"
-            }
-        },
-        "Finance": {
-            "qa": "qaBatchFinance",
-            "prod": "prodBatchFinance",
-            "DR": "DRBatchFinance",
-            "pool": {
-                "qa": "qapoolBatchFinance",
-                "prod": "prodpoolBatchFinance",
-                "DR": "DRpoolBatchFinance"
-            }
-        },
-        "Customer": {
-            "qa": "qaBatchCustomer",
-            "prod": "prodBatchCustomer",
-            "DR": "DRBatchCustomer",
-            "pool": {
-                "qa": "qapoolBatchCustomer",
-                "prod": "prodpoolBatchCustomer",
-                "DR": "DRpoolBatchCustomer"
-            }
-        },
-        "Accounting": {
-            "qa": "qaBatchAccounting",
-            "prod": "prodBatchAccounting",
-            "DR": "DRBatchAccounting",
-            "pool": {
-                "qa": "qapoolBatchAccounting",
-                "prod": "prodpoolBatchAccounting",
-                "DR": "DRpoolBatchAccounting"
-            }
-        },
-        "Nonedw": {
-            "qa": "qaBatchNonedw",
-            "prod": "prodBatchNonedw",
-            "DR": "DRBatchNonedw",
-            "pool": {
-                "qa": "qapoolBatchNonedw",
-                "prod": "prodpoolBatchNonedw",
-                "DR": "DRpoolBatchNonedw"
+    """Return the mapping dictionaries for resources (shared, do not modify)."""
+    return _MAPS
+
+class DomainNames(NamedTuple):
+    """Resource names of one domain in one environment.
+    Retail only has ADF resources, so its other names are None."""
+    rg: str
+    adf: str
+    batch: Optional[str] = None
+    pool: Optional[str] = None
+    kv: Optional[str] = None
+    storage: Optional[str] = None
+
+def _domain_names(domain: str, env_key: str) -> DomainNames:
+    """Look up all resource names of a domain in one environment (e.g. 'qa' or 'DR')."""
+    rg = RG_MAP[domain][env_key]
+    adf = ADF_MAP[domain][env_key]
+    batch = BATCH_MAP.get(domain)
+    if batch is None:
+        return DomainNames(rg, adf)
+    return DomainNames(
+        rg, adf, batch[env_key], batch["pool"][env_key],
+        KV_MAP[domain][env_key], STORAGE_MAP[domain][env_key]
+    )
+
+def _domain_sections(
+    domain: str,
+    env: str,
+    mode: str,
+    storage: bool,
+    snowflake: bool,
+    azure: bool,
+    azure_sections: bool = True
+) -> Dict[str, Dict]:
+    """Build one domain's entry for every enabled section, in output order.
+    Retail only has ADF resources, so it only gets the ADF sections.
+    azure_sections=False leaves out the Azure sections while azure still picks the FQDN ADF."""
+    n = {key: _domain_names(domain, key) for key in (env, "DR")}
+    has_batch = n[env].batch is not None
+    # failover brings DR up and east down, failback the reverse
+    up, down = (n["DR"], n[env]) if mode == "failover" else (n[env], n["DR"])
+
+    sections = {}
+    if storage and has_batch:
+        sections["storageGRS"] = {
+            "resourceGroup": n[env].rg,
+            "storage": n[env].storage
+        }
+
+    if snowflake:
+        # azure not fail, failover the fqdn in east ADF
+        # azure fail, failover the fqdn in DR ADF
+        # failback only the fqdn in east ADF
+        fqdn = n["DR"] if mode == "failover" and azure else n[env]
+        sections["ADFLinkedServiceFQDN"] = {
+            "resourceGroup": fqdn.rg,
+            "adf": fqdn.adf
+        }
+
+    if azure and azure_sections:
+        if has_batch:
+            # Create new batchAccountScale structure
+            # failover scale up DR, scale down east
+            # failback scale up east, scale down DR
+            sections["batchAccountScale"] = {
+                "scaleUp": {
+                    "resourceGroup": up.rg,
+                    "batch": up.batch,
+                    "pool": up.pool
+                },
+                "scaleDown": {
+                    "resourceGroup": down.rg,
+                    "batch": down.batch,
+                    "pool": down.pool
+                }
             }
-        },
-        "Associates": {
-            "qa": "qaBatchAssociates",
-            "prod": "prodBatchAssociates",
-            "DR": "DRBatchAssociates",
-            "pool": {
-                "qa": "qapoolBatchAssociates",
-                "prod": "prodpoolBatchAssociates",
-                "DR": "DRpoolBatchAssociates"
+
+        # Create new ADFTrigger structure
+        # failover start DR, stop east
+        # failback start east, stop DR
+        sections["ADFTrigger"] = {
+            "start": {
+                "resourceGroup": up.rg,
+                "adf": up.adf
+            },
+            "stop": {
+                "resourceGroup": down.rg,
+                "adf": down.adf
             }
         }
-    }
-
-    storage_map = {
-        "Sales": {"qa": "qaStorageSales", "prod": "prodStorageSales", "DR": "DRStorageSales"},
-        "Finance": {"qa": "qaStorageFinance", "prod": "prodStorageFinance", "DR": "DRStorageFinance"},
-        "Customer": {"qa": "qaStorageCustomer", "prod": "prodStorageCustomer", "DR": "DRStorageCustomer"},
-        "Accounting": {"qa": "qaStorageAccounting", "prod": "prodStorageAccounting", "DR": "DRStorageAccounting"},
-        "Nonedw": {"qa": "qaStorageNonedw", "prod": "prodStorageNonedw", "DR": "DRStorageNonedw"},
-        "Associates": {"qa": "qaStorageAssociates", "prod": "prodStorageAssociates", "DR": "DRStorageAssociates"}
-    }
 
-    kv_map = {
-        "Sales": {"qa": "qaKvSales", "prod": "prodKvSales", "DR": "DRKvSales"},
-        "Finance": {"qa": "qaKvFinance", "prod": "prodKvFinance", "DR": "DRKvFinance"},
-        "Customer": {"qa": "qaKvCustomer", "prod": "prodKvCustomer", "DR": "DRKvCustomer"},
-        "Accounting": {"qa": "qaKvAccounting", "prod": "prodKvAccounting", "DR": "DRKvAccounting"},
-        "Nonedw": {"qa": "qaKvNonedw", "prod": "prodKvNonedw", "DR": "DRKvNonedw"},
-        "Associates": {"qa": "qaKvAssociates", "prod": "prodKvAssociates", "DR": "DRKvAssociates"}
-    }
+        if has_batch:
+            # Create new kvSync structure
+            # failover and failback are the same, failback will not call kvSync
+            sections["kvSync"] = {
+                "from": {
+                    "resourceGroup": n[env].rg,
+                    "kv": n[env].kv
+                },
+                "to": {
+                    "resourceGroup": n["DR"].rg,
+                    "kv": n["DR"].kv
+                }
+            }
 
-    adf_map = {
-        "Sales": {"qa": "qaSalesADF", "prod": "prodSalesADF", "DR": "DRSalesADF"},
-        "Finance": {"qa": "qaFinanceADF", "prod": "prodFinanceADF", "DR": "DRFinanceADF"},
-        "Customer": {"qa": "qaCustomerADF", "prod": "prodCustomerADF", "DR": "DRCustomerADF"},
-        "Accounting": {"qa": "qaAccountingADF", "prod": "prodAccountingADF", "DR": "DRAccountingADF"},
-        "Retail": {"qa": "qaRetailADF", "prod": "prodRetailADF", "DR": "DRRetailADF"},
-        "Nonedw": {"qa": "qaNonedwADF", "prod": "prodNonedwADF", "DR": "DRNonedwADF"},
-        "Associates": {"qa": "qaAssociatesADF", "prod": "prodAssociatesADF", "DR": "DRAssociatesADF"}
-    }
+    return sections
 
-    rg_map = {
-        "Sales": {"qa": "qaSalesRG", "prod": "prodSalesRG", "DR": "DRSalesRG"},
-        "Finance": {"qa": "qaFinanceRG", "prod": "prodFinanceRG", "DR": "DRFinanceRG"},
-        "Customer": {"qa": "qaCustomerRG", "prod": "prodCustomerRG", "DR": "DRCustomerRG"},
-        "Accounting": {"qa": "qaAccountingRG", "prod": "prodAccountingRG", "DR": "DRAccountingRG"},
-        "Retail": {"qa": "qaRetailRG", "prod": "prodRetailRG", "DR": "DRRetailRG"},
-        "Nonedw": {"qa": "qaNonedwRG", "prod": "prodNonedwRG", "DR": "DRNonedwRG"},
-        "Associates": {"qa": "qaAssociatesRG", "prod": "prodAssociatesRG", "DR": "DRAssociatesRG"}
-    }
+def _all_domain_sections(
+    env: str,
+    mode: str,
+    storage: bool,
+    snowflake: bool,
+    azure: bool,
+    azure_sections: bool = True
+) -> Dict[str, List[Dict]]:
+    """Build every enabled section of an "All" build in one pass over the domains."""
+    sections: Dict[str, List[Dict]] = {}
+    for d in ADF_DOMAINS:  # Use ADF_DOMAINS to include Retail
+        domain_sections = _domain_sections(d, env, mode, storage, snowflake, azure, azure_sections)
+        for key, entry in domain_sections.items():
+            sections.setdefault(key, []).append(entry)
+    return sections
 
-    return {
-        "batch_map": batch_map,
-        "storage_map": storage_map,
-        "kv_map": kv_map,
-        "adf_map": adf_map,
-        "rg_map": rg_map
-    }
+# The Azure sections of an "All" build only depend on environment and mode, so all
+# four variants are built once at import. generate_json returns these lists as-is;
+# callers must not modify them in place.
+_AZURE_VARIANTS = {
+    (env, mode): _all_domain_sections(env, mode, storage=False, snowflake=False, azure=True)
+    for env in SOURCE_ENVS
+    for mode in ("failover", "failback")
+}
 
 def generate_json(
     mode: str = 'failover',
@@ -120,22 +233,20 @@ def generate_json(
     azure: bool = True,
     domain: str = 'Sales',
     environment: str = 'qa',
-    customer_json: Optional[str] = None
+    customer_json: Optional[Union[str, bytes, Dict]] = None
 ) -> Dict:
-    """Generate the JSON configuration based on input parameters."""
+    """Generate the JSON configuration based on input parameters.
+    A customer_json configuration (already parsed, or JSON text) is returned as-is.
+    For "All" builds the Azure sections are shared between calls, so treat the result as read-only."""
     if customer_json:
-        return json.loads(customer_json)
-
-    maps = create_maps()
-    batch_map = maps["batch_map"]
-    storage_map = maps["storage_map"]
-    kv_map = maps["kv_map"]
-    adf_map = maps["adf_map"]
-    rg_map = maps["rg_map"]
-
-    json_data = {}
-    # Add config first
-    json_data["config"] = {
+        return customer_json if isinstance(customer_json, dict) else from_json(customer_json)
+
+    env = environment.lower()
+    if env not in SOURCE_ENVS:
+        raise ValueError(f"Environment must be one of {SOURCE_ENVS}, got '{environment}'")
+
+    # config first
+    config = {
         "mode": mode,
         "storage": storage,
         "snowflake": snowflake,
@@ -144,185 +255,61 @@ def generate_json(
         "environment": environment
     }
 
-    ordered_domains = ["Sales", "Finance", "Customer", "Accounting", "Nonedw", "Associates"]
-    adf_domains = ordered_domains + ["Retail"]  # Include Retail only for ADF operations
-
-    if domain == "All":
-        if storage:
-            json_data["storageGRS"] = [
-                {
-                    "resourceGroup": rg_map[d][environment.lower()],
-                    "storage": storage_map[d][environment.lower()]
-                }
-                for d in ordered_domains
-            ]
-
-        if snowflake:
-            # azure not fail, failover the fqdn in east ADF
-            # azure fail, failover the fqdn in DR ADF
-            # failback only the fqdn in east ADF
-            if mode == "failover":
-                json_data["ADFLinkedServiceFQDN"] = [
-                    {
-                        "resourceGroup": rg_map[d]["DR"] if azure else rg_map[d][environment.lower()],
-                        "adf": adf_map[d]["DR"] if azure else adf_map[d][environment.lower()]
-                    }
-                    for d in adf_domains  # Use adf_domains to include Retail
-                ]
-            else:
-                json_data["ADFLinkedServiceFQDN"] = [
-                    {
-                        "resourceGroup": rg_map[d][environment.lower()],
-                        "adf": adf_map[d][environment.lower()]
-                    }
-                    for d in adf_domains  # Use adf_domains to include Retail
-                ]
-
-        if azure:
-            # Create new batchAccountScale structure
-            # failover scale up DR, scale down east
-            # failback scale up east, scale down DR
-            json_data["batchAccountScale"] = [
-                {
-                    "scaleUp": {
-                        "resourceGroup": rg_map[d]["DR"] if mode == "failover" else rg_map[d][environment.lower()],
-                        "batch": batch_map[d]["DR"] if mode == "failover" else batch_map[d][environment.lower()],
-                        "pool": batch_map[d]["pool"]["DR"] if mode == "failover" else batch_map[d]["pool"][environment.lower()]
-                    },
-                    "scaleDown": {
-                        "resourceGroup": rg_map[d][environment.lower()] if mode == "failover" else rg_map[d]["DR"],
-                        "batch": batch_map[d][environment.lower()] if mode == "failover" else batch_map[d]["DR"],
-                        "pool": batch_map[d]["pool"][environment.lower()] if mode == "failover" else batch_map[d]["pool"]["DR"]
-                    }
-                }
-                for d in ordered_domains
-            ]
-
-            # Create new ADFTrigger structure
-            # failover start DR, stop east
-            # failback start east, stop DR
-            json_data["ADFTrigger"] = [
-                {
-                    "start": {
-                        "resourceGroup": rg_map[d]["DR"] if mode == "failover" else rg_map[d][environment.lower()],
-                        "adf": adf_map[d]["DR"] if mode == "failover" else adf_map[d][environment.lower()]
-                    },
-                    "stop": {
-                        "resourceGroup": rg_map[d][environment.lower()] if mode == "failover" else rg_map[d]["DR"],
-                        "adf": adf_map[d][environment.lower()] if mode == "failover" else adf_map[d]["DR"]
-                    }
-                }
-                for d in adf_domains  # Use adf_domains to include Retail
-            ]
-
-            # Create new kvSync structure
-            # failover and failback are the same, failback will not call kvSync
-            json_data["kvSync"] = [
-                {
-                    "from": {
-                        "resourceGroup": rg_map[d][environment.lower()],
-                        "kv": kv_map[d][environment.lower()]
-                    },
-                    "to": {
-                        "resourceGroup": rg_map[d]["DR"],
-                        "kv": kv_map[d]["DR"]
-                    }
-                }
-                for d in ordered_domains
-            ]
-    else:
+    if domain != "All":
         if domain == "Retail":
             raise ValueError("Retail domain can only be used in 'All' mode for ADF operations")
+        return {"config": config, **_domain_sections(domain, env, mode, storage, snowflake, azure)}
 
-        if storage:
-            json_data["storageGRS"] = {
-                "resourceGroup": rg_map[domain][environment.lower()],
-                "storage": storage_map[domain][environment.lower()]
-            }
-
-        if snowflake:
-            # azure not fail, failover the fqdn in east ADF
-            # azure fail, failover the fqdn in DR ADF
-            # failback only the fqdn in east ADF
-            if mode == "failover":
-                json_data["ADFLinkedServiceFQDN"] = {
-                    "resourceGroup": rg_map[domain]["DR"] if azure else rg_map[domain][environment.lower()],
-                    "adf": adf_map[domain]["DR"] if azure else adf_map[domain][environment.lower()]
-                }
-            else:
-                json_data["ADFLinkedServiceFQDN"] = {
-                    "resourceGroup": rg_map[domain][environment.lower()],
-                    "adf": adf_map[domain][environment.lower()]
-                }
-
-        if azure:
-            # Create new batchAccountScale structure for single domain
-            # failover scale up DR, scale down east
-            # failback scale up east, scale down DR
-            json_data["batchAccountScale"] = {
-                "scaleUp": {
-                    "resourceGroup": rg_map[domain]["DR"] if mode == "failover" else rg_map[domain][environment.lower()],
-                    "batch": batch_map[domain]["DR"] if mode == "failover" else batch_map[domain][environment.lower()],
-                    "pool": batch_map[domain]["pool"]["DR"] if mode == "failover" else batch_map[domain]["pool"][environment.lower()]
-                },
-                "scaleDown": {
-                    "resourceGroup": rg_map[domain][environment.lower()] if mode == "failover" else rg_map[domain]["DR"],
-                    "batch": batch_map[domain][environment.lower()] if mode == "failover" else batch_map[domain]["DR"],
-                    "pool": batch_map[domain]["pool"][environment.lower()] if mode == "failover" else batch_map[domain]["pool"]["DR"]
-                }
-            }
-
-            # Create new ADFTrigger structure for single domain
-            # failover start DR, stop east
-            # failback start east, stop DR
-            json_data["ADFTrigger"] = {
-                "start": {
-                    "resourceGroup": rg_map[domain]["DR"] if mode == "failover" else rg_map[domain][environment.lower()],
-                    "adf": adf_map[domain]["DR"] if mode == "failover" else adf_map[domain][environment.lower()]
-                },
-                "stop": {
-                    "resourceGroup": rg_map[domain][environment.lower()] if mode == "failover" else rg_map[domain]["DR"],
-                    "adf": adf_map[domain][environment.lower()] if mode == "failover" else adf_map[domain]["DR"]
-                }
-            }
+    # Reuse the precomputed Azure sections when this (environment, mode) has them
+    azure_part = _AZURE_VARIANTS.get((env, mode), {}) if azure else {}
+    parts = _all_domain_sections(env, mode, storage, snowflake, azure, azure_sections=not azure_part)
+    return {"config": config, **parts, **azure_part}
 
-            # Create new kvSync structure for single domain
-            # failover and failback are the same, failback will not call kvSync
-            json_data["kvSync"] = {
-                "from": {
-                    "resourceGroup": rg_map[domain][environment.lower()],
-                    "kv": kv_map[domain][environment.lower()]
-                },
-                "to": {
-                    "resourceGroup": rg_map[domain]["DR"],
-                    "kv": kv_map[domain]["DR"]
-                }
-            }
-
-    return json_data
+def _str2bool(value: str) -> bool:
+    """Convert a True/False command line value (any case) to a boolean."""
+    lowered = value.lower()
+    if lowered not in ('true', 'false'):
+        # argparse turns a ValueError from a type function into a usage error
+        raise ValueError(value)
+    return lowered == 'true'
 
 def main():
+    # Only the CLI needs argparse; modules importing build (the DR scripts) skip it
+    import argparse
+
     parser = argparse.ArgumentParser(description='Generate configuration JSON for DR pipeline')
     parser.add_argument('--mode', choices=['failover', 'failback'], default='failover',
                       help='Operation mode (default: failover)')
-    parser.add_argument('--storage', type=str, choices=['True', 'False'], default='False',
+    parser.add_argument('--storage', type=_str2bool, default='False',
                       help='Include storage configuration (True/False)')
-    parser.add_argument('--snowflake', type=str, choices=['True', 'False'], default='False',
+    parser.add_argument('--snowflake', type=_str2bool, default='False',
                       help='Include Snowflake configuration (True/False)')
-    parser.add_argument('--azure', type=str, choices=['True', 'False'], default='True',
+    parser.add_argument('--azure', type=_str2bool, default='True',
                       help='Include Azure configuration (True/False)')
     parser.add_argument('--domain', choices=['All', 'Sales', 'Finance', 'Customer', 'Accounting', 'Nonedw', 'Associates'],
                       default='Sales', help='Target domain (default: Sales)')
-    parser.add_argument('--environment', choices=['qa', 'prod'], default='qa',
+    parser.add_argument('--environment', choices=SOURCE_ENVS, default='qa',
                       help='Target environment (default: qa)')
-    parser.add_argument('--customer-json', help='Customer JSON input')
+    customer_group = parser.add_mutually_exclusive_group()
+    customer_group.add_argument('--customer-json', help='Customer JSON input')
+    customer_group.add_argument('--customer-json-file', help='Path to a file with the customer JSON input')
+    parser.add_argument('--quiet', action='store_true',
+                      help='Do not print the configuration summary')
+    parser.add_argument('--verbose', action='store_true',
+                      help='Also print the generated JSON after writing build.json')
+    parser.add_argument('--stdout-json', action='store_true',
+                      help='Write the generated JSON to stdout instead of build.json')
 
     args = parser.parse_args()
 
-    # Convert string boolean values to actual booleans
-    storage = args.storage.lower() == 'true'
-    snowflake = args.snowflake.lower() == 'true'
-    azure = args.azure.lower() == 'true'
+    storage = args.storage
+    snowflake = args.snowflake
+    azure = args.azure
+
+    customer_json = args.customer_json
+    if args.customer_json_file:
+        with open(args.customer_json_file, 'rb') as f:
+            customer_json = f.read()
 
     json_data = generate_json(
         mode=args.mode,
@@ -331,24 +318,33 @@ def main():
         azure=azure,
         domain=args.domain,
         environment=args.environment,
-        customer_json=args.customer_json
+        customer_json=customer_json
     )
 
-    # Print configuration for debugging
-    print("Mode:", args.mode)
-    print("Storage Down:", storage)
-    print("Snowflake Down:", snowflake)
-    print("Azure Down:", azure)
-    print("Domain:", args.domain)
-    print("Environment:", args.environment)
-
-    # Write JSON to file
-    with open('build.json', 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, indent=2)
-
-    # Print generated JSON for debugging
-    print("\nGenerated JSON:")
-    print(json.dumps(json_data, indent=2))
+    # Serialize once for the file and the optional debug print
+    payload = to_json(json_data)
+
+    if args.stdout_json:
+        print(payload.decode('utf-8'))
+        return
+
+    if not args.quiet:
+        # Print configuration for debugging
+        print("Mode:", args.mode)
+        print("Storage Down:", storage)
+        print("Snowflake Down:", snowflake)
+        print("Azure Down:", azure)
+        print("Domain:", args.domain)
+        print("Environment:", args.environment)
+
+    # Write JSON to file in one binary write
+    with open('build.json', 'wb') as f:
+        f.write(payload)
+
+    if args.verbose:
+        # Print generated JSON for debugging
+        print("\nGenerated JSON:")
+        print(payload.decode('utf-8'))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
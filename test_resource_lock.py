@@ -1,77 +1,86 @@
-from AzHelper import AzureResourceLocker
+import os
+from AzHelper import AzureResourceLock
 
-def test_resource_locker():
+# Set LOCK_TEST_DEBUG=1 to print lock names after every step
+DEBUG = os.environ.get("LOCK_TEST_DEBUG") == "1"
+
+
+def print_lock_names(label, locks):
+    """Print the names of locks, only when DEBUG is on"""
+    if DEBUG:
+        print(label, ", ".join(lock.name for lock in locks))
+
+def test_resource_lock():
     """
-    Test AzureResourceLocker functionality:
+    Test AzureResourceLock functionality:
     1. Get initial locks
     2. Create a new lock
     3. Delete all locks
     4. Recreate all locks
     """
-    print("\nTesting AzureResourceLocker...")
+    print("\nTesting AzureResourceLock...")
     
     # Initialize the locker
-    locker = AzureResourceLocker(resource_group_name="adf")
-    print("\nInitial lock_objs:", [lock.name for lock in locker.lock_objs])
+    locker = AzureResourceLock(resource_group_name="adf")
+    print_lock_names("\nInitial lock_objs:", locker.lock_objs)
     
     # Test 1: Get initial locks
     print("\nTest 1: Getting initial locks")
     initial_locks = locker.lock_objs
     print(f"Initial locks count: {len(initial_locks)}")
-    print("Initial lock_objs:", [lock.name for lock in locker.lock_objs])
+    print_lock_names("Initial lock_objs:", locker.lock_objs)
     
     # Test 2: Create a new lock
     print("\nTest 2: Creating a new lock")
     test_lock_name = "test-lock"
-    locker.create_resource_lock(
+    locker.create_lock(
         lock_name=test_lock_name,
         level="CanNotDelete",
         notes="Test lock for automation"
     )
-    print("After create lock_objs:", [lock.name for lock in locker.lock_objs])
+    print_lock_names("After create lock_objs:", locker.lock_objs)
+    assert test_lock_name in locker.locks_by_name, "Created lock not tracked locally"
     
     # Verify the lock was created
     current_locks = locker.get_locks()  # Get current locks without updating lock_objs
-    print("Current locks from get_locks:", [lock.name for lock in current_locks])
-    found_lock = False
-    for lock in current_locks:
-        if lock.name == test_lock_name:
-            found_lock = True
-            print(f"Found created lock: {lock.name} with level {lock.level}")
-            break
+    print_lock_names("Current locks from get_locks:", current_locks)
+    locks_by_name = {lock.name: lock for lock in current_locks}
+    found_lock = test_lock_name in locks_by_name
+    if found_lock:
+        lock = locks_by_name[test_lock_name]
+        print(f"Found created lock: {lock.name} with level {lock.level}")
     assert found_lock, "Created lock not found in lock list"
     
     # Test 3: Delete all locks
     print("\nTest 3: Deleting all locks")
-    locker.delete_resource_locks()
-    print("After delete lock_objs:", [lock.name for lock in locker.lock_objs])
+    locker.release_locks()
+    print_lock_names("After delete lock_objs:", locker.lock_objs)
     assert locker.deleted, "Locks were not marked as deleted"
     
     # Verify locks were deleted
     current_locks = locker.get_locks()  # Get current locks without updating lock_objs
-    print("Current locks after delete:", [lock.name for lock in current_locks])
+    print_lock_names("Current locks after delete:", current_locks)
     assert len(current_locks) == 0, "Locks were not deleted"
     
     # Test 4: Recreate all locks
     print("\nTest 4: Recreating all locks")
     locker.recreate_locks()
-    print("After recreate lock_objs:", [lock.name for lock in locker.lock_objs])
+    print_lock_names("After recreate lock_objs:", locker.lock_objs)
     
     # Verify locks were recreated
     current_locks = locker.get_locks()  # Get current locks without updating lock_objs
-    print("Current locks after recreate:", [lock.name for lock in current_locks])
+    print_lock_names("Current locks after recreate:", current_locks)
     assert len(current_locks) == len(initial_locks) + 1, "Locks were not recreated correctly"
     
     # Verify the test lock was recreated
-    found_lock = False
-    for lock in current_locks:
-        if lock.name == test_lock_name:
-            found_lock = True
-            print(f"Found recreated lock: {lock.name} with level {lock.level}")
-            break
+    locks_by_name = {lock.name: lock for lock in current_locks}
+    found_lock = test_lock_name in locks_by_name
+    if found_lock:
+        lock = locks_by_name[test_lock_name]
+        print(f"Found recreated lock: {lock.name} with level {lock.level}")
     assert found_lock, "Test lock was not recreated"
     
-    print("\nAll AzureResourceLocker tests completed successfully!")
+    print("\nAll AzureResourceLock tests completed successfully!")
 
 if __name__ == "__main__":
-    test_resource_locker() 
\ No newline at end of file
+    test_resource_lock() 
\ No newline at end of file